@@ -38,6 +38,7 @@ Guarantees:
 - Artifacts are decision records only; they do not override execution truth
 """
 
+import functools
 import json
 import sys
 import os
@@ -183,65 +184,19 @@ def _validate_l4_transition(proposal: Dict) -> Tuple[bool, Optional[Dict], Optio
         - If valid: (True, transition_payload_dict, None)
         - If invalid: (False, None, reason_code_string)
     """
-    try:
-        # Import L-4 state machine components
-        _src_path = os.path.join(_REPO_ROOT, 'src')
-        if _src_path not in sys.path:
-            sys.path.insert(0, _src_path)
-
-        from l4_state_machine.states import (
-            OrderState,
-            INITIAL_STATE,
-            TERMINAL_STATES,
-            DEMO_ORDER_ID,
-        )
-        from l4_state_machine.events import EventToken, VALID_EVENT_TOKENS
-        from l4_state_machine.transitions import apply_transition
-
-        # Extract event_token from proposal
-        payload = proposal.get("payload")
-        if not isinstance(payload, dict):
-            return (False, None, "INVALID_EVENT_TOKEN")
-
-        event_token_str = payload.get("event_token")
-        if not isinstance(event_token_str, str):
-            return (False, None, "INVALID_EVENT_TOKEN")
-
-        # Validate event_token is in closed set
-        try:
-            event_token = EventToken(event_token_str)
-        except ValueError:
-            return (False, None, "INVALID_EVENT_TOKEN")
-
-        # Apply transition from fixed initial state (CREATED)
-        current_state = INITIAL_STATE
-        result = apply_transition(current_state, event_token)
-
-        if not result.valid:
-            # Map error code to L-4 reject reason
-            if result.error_code == "INVALID_EVENT_TOKEN":
-                return (False, None, "INVALID_EVENT_TOKEN")
-            elif result.error_code == "ILLEGAL_TRANSITION":
-                return (False, None, "ILLEGAL_TRANSITION")
-            elif result.error_code == "INVALID_CURRENT_STATE":
-                return (False, None, "INVALID_CURRENT_STATE")
-            else:
-                return (False, None, "ILLEGAL_TRANSITION")
-
-        # Build transition payload
-        next_state = result.next_state
-        is_terminal = next_state in TERMINAL_STATES
-
-        transition_payload = {
-            "order_id": DEMO_ORDER_ID,
-            "previous_state": current_state.value,
-            "event": event_token.value,
-            "current_state": next_state.value,
-            "terminal": is_terminal,
-        }
+    # Extract event_token from proposal
+    payload = proposal.get("payload")
+    if not isinstance(payload, dict):
+        return (False, None, "INVALID_EVENT_TOKEN")
 
-        return (True, transition_payload, None)
+    event_token_str = payload.get("event_token")
+    if not isinstance(event_token_str, str):
+        return (False, None, "INVALID_EVENT_TOKEN")
 
+    # Only a resolved token is memoized: failures to import or run the
+    # state machine propagate out of the cached function and land here.
+    try:
+        is_valid, transition, reject_reason = _l4_transition_for_token(event_token_str)
     except ImportError:
         # L-4 module not available
         return (False, None, "INVALID_EVENT_TOKEN")
@@ -249,6 +204,76 @@ def _validate_l4_transition(proposal: Dict) -> Tuple[bool, Optional[Dict], Optio
         # Any other error
         return (False, None, "INVALID_EVENT_TOKEN")
 
+    if not is_valid:
+        return (False, None, reject_reason)
+
+    # Fresh payload per artifact; the cached tuple is never handed out
+    return (True, dict(transition), None)
+
+
+@functools.lru_cache(maxsize=256)
+def _l4_transition_for_token(
+    event_token_str: str
+) -> Tuple[bool, Optional[Tuple[Tuple[str, Any], ...]], Optional[str]]:
+    """
+    Resolve an event token string against the frozen state machine.
+
+    The result depends only on the token (the initial state is fixed), so
+    it is memoized; the bound keeps arbitrary proposal strings from growing
+    the cache. The transition payload is returned as an immutable tuple of
+    items so a cached entry cannot be mutated through an artifact. Import
+    and other unexpected errors are raised, not returned, so they are never
+    cached.
+    """
+    # Import L-4 state machine components
+    _src_path = os.path.join(_REPO_ROOT, 'src')
+    if _src_path not in sys.path:
+        sys.path.insert(0, _src_path)
+
+    from l4_state_machine.states import (
+        OrderState,
+        INITIAL_STATE,
+        TERMINAL_STATES,
+        DEMO_ORDER_ID,
+    )
+    from l4_state_machine.events import EventToken, VALID_EVENT_TOKENS
+    from l4_state_machine.transitions import apply_transition
+
+    # Validate event_token is in closed set
+    try:
+        event_token = EventToken(event_token_str)
+    except ValueError:
+        return (False, None, "INVALID_EVENT_TOKEN")
+
+    # Apply transition from fixed initial state (CREATED)
+    current_state = INITIAL_STATE
+    result = apply_transition(current_state, event_token)
+
+    if not result.valid:
+        # Map error code to L-4 reject reason
+        if result.error_code == "INVALID_EVENT_TOKEN":
+            return (False, None, "INVALID_EVENT_TOKEN")
+        elif result.error_code == "ILLEGAL_TRANSITION":
+            return (False, None, "ILLEGAL_TRANSITION")
+        elif result.error_code == "INVALID_CURRENT_STATE":
+            return (False, None, "INVALID_CURRENT_STATE")
+        else:
+            return (False, None, "ILLEGAL_TRANSITION")
+
+    # Build transition payload
+    next_state = result.next_state
+    is_terminal = next_state in TERMINAL_STATES
+
+    transition_payload = (
+        ("order_id", DEMO_ORDER_ID),
+        ("previous_state", current_state.value),
+        ("event", event_token.value),
+        ("current_state", next_state.value),
+        ("terminal", is_terminal),
+    )
+
+    return (True, transition_payload, None)
+
 
 def build_artifact(
     proposal_set: Any,
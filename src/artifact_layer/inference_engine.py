@@ -38,6 +38,7 @@ authorization. Fixed-path contract established per Prompt 1.
 """
 
 import base64
+import functools
 from pathlib import Path
 
 # =============================================================================
@@ -50,6 +51,7 @@ from pathlib import Path
 _MODEL_RELATIVE_PATH: str = "models/local_llm/model.bin"
 
 
+@functools.lru_cache(maxsize=1)
 def _get_model_path() -> Path:
     """
     Get the fixed model path.
@@ -58,6 +60,7 @@ def _get_model_path() -> Path:
     - Path is hard-coded as models/local_llm/model.bin
     - No configuration surface (no env/CLI/config override)
     - Path is resolved relative to repository root
+    - Resolved once per process (the inputs never change)
 
     Returns:
         Absolute path to the vendored model file.
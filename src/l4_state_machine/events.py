@@ -70,6 +70,8 @@ EVENT_TOKEN_TRANSITIONS: Dict[EventToken, Tuple[OrderState, OrderState]] = {
 }
 
 # States from which cancel_order is allowed
+# Kept as a frozenset: OrderState is a str enum, so membership is one
+# C-level str-hash probe (measured faster than a tuple scan here)
 CANCELLATION_ALLOWED_FROM: FrozenSet[OrderState] = frozenset([
     OrderState.CREATED,
     OrderState.PAYMENT_PENDING,
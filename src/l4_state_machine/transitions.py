@@ -10,16 +10,14 @@ Constraints:
 - No side effects
 """
 
-from dataclasses import dataclass
-from typing import Dict, FrozenSet, Optional, Tuple, Set
+from typing import Dict, FrozenSet, NamedTuple, Optional, Tuple, Set
 from .states import OrderState, TERMINAL_STATES
 from .events import EventToken, EVENT_TOKEN_TRANSITIONS, CANCELLATION_ALLOWED_FROM
 
 
-@dataclass(frozen=True)
-class TransitionResult:
+class TransitionResult(NamedTuple):
     """
-    Result of a transition attempt.
+    Result of a transition attempt (immutable).
 
     Attributes:
         valid: Whether the transition is legal
@@ -56,6 +54,20 @@ ALLOWED_TRANSITIONS: FrozenSet[Tuple[OrderState, OrderState]] = frozenset([
 ])
 
 
+# Legal (current_state, event_token) -> next_state, built once from the
+# frozen event tables. Any pair not present is an illegal transition.
+_NEXT_STATE: Dict[Tuple[OrderState, EventToken], OrderState] = {
+    **{
+        (from_state, event_token): to_state
+        for event_token, (from_state, to_state) in EVENT_TOKEN_TRANSITIONS.items()
+    },
+    **{
+        (from_state, EventToken.CANCEL_ORDER): OrderState.CANCELLED
+        for from_state in CANCELLATION_ALLOWED_FROM
+    },
+}
+
+
 def is_valid_transition(from_state: OrderState, to_state: OrderState) -> bool:
     """
     Check if a state transition is allowed.
@@ -122,33 +134,18 @@ def apply_transition(
             error_code="INVALID_EVENT_TOKEN"
         )
 
-    # Handle cancel_order specially (multiple allowed from_states)
-    if event_token == EventToken.CANCEL_ORDER:
-        if current_state in CANCELLATION_ALLOWED_FROM:
-            return TransitionResult(
-                valid=True,
-                next_state=OrderState.CANCELLED,
-                error_code=None
-            )
-        else:
+    # One table lookup covers both standard and cancellation edges
+    next_state = _NEXT_STATE.get((current_state, event_token))
+
+    if next_state is None:
+        if (event_token != EventToken.CANCEL_ORDER
+                and event_token not in EVENT_TOKEN_TRANSITIONS):
+            # Should not happen if EventToken enum is complete
             return TransitionResult(
                 valid=False,
                 next_state=None,
-                error_code="ILLEGAL_TRANSITION"
+                error_code="INVALID_EVENT_TOKEN"
             )
-
-    # Standard event tokens
-    if event_token not in EVENT_TOKEN_TRANSITIONS:
-        # Should not happen if EventToken enum is complete
-        return TransitionResult(
-            valid=False,
-            next_state=None,
-            error_code="INVALID_EVENT_TOKEN"
-        )
-
-    expected_from, next_state = EVENT_TOKEN_TRANSITIONS[event_token]
-
-    if current_state != expected_from:
         return TransitionResult(
             valid=False,
             next_state=None,
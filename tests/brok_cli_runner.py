@@ -0,0 +1,118 @@
+"""
+In-process runner for ./brok, shared by the L-1, L-2 and L-3 tests.
+
+Calls the CLI's main() directly: same entrypoint, argument parsing and
+run-ID derivation as ./brok, without paying for a fresh interpreter and
+re-import of the pipeline on every run. The report printed by the CLI is
+discarded; callers assert on the exit code and the files the run wrote.
+"""
+
+import contextlib
+import functools
+import importlib.machinery
+import importlib.util
+import io
+import json
+import os
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+BROK_CLI = REPO_ROOT / 'brok'
+
+
+@functools.lru_cache(maxsize=1)
+def load_brok_cli():
+    """Load ./brok as a module (it has no .py suffix, so use an explicit loader)."""
+    loader = importlib.machinery.SourceFileLoader('brok_cli', str(BROK_CLI))
+    spec = importlib.util.spec_from_loader('brok_cli', loader)
+    brok_cli = importlib.util.module_from_spec(spec)
+    loader.exec_module(brok_cli)
+    return brok_cli
+
+
+@contextlib.contextmanager
+def silenced_output():
+    """
+    Silence stdout and stderr at the file-descriptor level.
+
+    cli_output binds sys.stdout/sys.stderr as default arguments at import
+    time, so contextlib.redirect_stdout() alone cannot hold back the
+    pipeline report.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved_fds = (os.dup(1), os.dup(2))
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    try:
+        os.dup2(devnull, 1)
+        os.dup2(devnull, 2)
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            yield
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(saved_fds[0], 1)
+        os.dup2(saved_fds[1], 2)
+        for fd in saved_fds + (devnull,):
+            os.close(fd)
+
+
+def output_paths(input_path):
+    """
+    Return (proposal_set_path, artifact_path) for a run on input_path.
+
+    The run ID depends only on the input content, so every run on the same
+    input writes these same two paths.
+    """
+    run_id = load_brok_cli()._generate_run_id(str(input_path))
+    return (
+        REPO_ROOT / 'artifacts' / 'proposals' / run_id / 'proposal_set.json',
+        REPO_ROOT / 'artifacts' / 'artifacts' / run_id / 'artifact.json',
+    )
+
+
+def call_main(input_path) -> int:
+    """
+    Run ./brok --input <input_path> once and return its exit code.
+
+    Files left at the run's output paths by an earlier run on the same
+    input are removed first, so a run that stops before writing them
+    cannot be judged on stale results.
+    """
+    brok_cli = load_brok_cli()
+    for path in output_paths(input_path):
+        path.unlink(missing_ok=True)
+
+    # main() and the pipeline prepend their source paths on every call;
+    # restore sys.path afterwards so repeated runs do not grow it.
+    saved_argv, saved_path = sys.argv, sys.path[:]
+    sys.argv = [str(BROK_CLI), '--input', str(input_path)]
+    try:
+        with silenced_output():
+            return brok_cli.main()
+    except SystemExit as e:
+        return e.code
+    finally:
+        sys.argv = saved_argv
+        sys.path[:] = saved_path
+
+
+def read_artifact(artifact_path) -> dict:
+    """Load the artifact a run wrote (empty if it wrote none)."""
+    try:
+        with open(artifact_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def run_cli(input_path):
+    """
+    Run ./brok --input <input_path> in-process.
+
+    Returns (exit_code, artifact_dict); the dict is empty if the run wrote
+    no artifact.
+    """
+    exit_code = call_main(input_path)
+    return exit_code, read_artifact(output_paths(input_path)[1])
@@ -17,13 +17,22 @@ Prohibitions checked:
 These are grep-based checks that verify absence of patterns.
 """
 
+import contextlib
+import io
 import os
 import re
-import subprocess
 import sys
 
 REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Shared test helpers live in tests/
+_TESTS_PATH = os.path.join(REPO_ROOT, 'tests')
+if _TESTS_PATH not in sys.path:
+    sys.path.append(_TESTS_PATH)
+
+import brok_cli_runner
+from repo_files import iter_files
+
 # Directories to exclude from repo-wide scans
 EXCLUDED_DIRS = {
     '.git',
@@ -45,8 +54,6 @@ SEAM_PATHS = [
     os.path.join(REPO_ROOT, 'src', 'artifact_layer'),
 ]
 
-BROK_CLI_PATH = os.path.join(REPO_ROOT, 'brok')
-
 
 def _should_skip_path(path: str) -> bool:
     """Check if path should be skipped based on exclusion rules."""
@@ -66,100 +73,179 @@ def _should_skip_path(path: str) -> bool:
     return False
 
 
-def _scan_repo_for_patterns(patterns: list, file_ext: str = '.py') -> tuple:
+def _collect_py_files(file_ext: str = '.py') -> list:
     """
-    Scan repo for prohibited patterns.
+    Walk the repo once and read every file subject to repo-wide scans.
+
+    Files are read as raw bytes; nothing is decoded unless a prohibited
+    pattern is found and a snippet has to be reported.
 
     Returns:
-        (passed, message) tuple
+        List of (rel_path, content_bytes) tuples, in walk order.
     """
-    for root, dirs, files in os.walk(REPO_ROOT):
-        # Modify dirs in-place to skip excluded directories
-        dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS]
+    collected = []
+    for fpath in iter_files(REPO_ROOT, EXCLUDED_DIRS, file_ext):
+        if _should_skip_path(fpath):
+            continue
 
-        if _should_skip_path(root):
+        try:
+            with open(fpath, 'rb') as f:
+                content = f.read()
+        except Exception:
             continue
 
-        for fname in files:
-            if not fname.endswith(file_ext):
-                continue
-            fpath = os.path.join(root, fname)
+        collected.append((os.path.relpath(fpath, REPO_ROOT), content))
 
-            if _should_skip_path(fpath):
-                continue
+    return collected
 
-            try:
-                with open(fpath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    lines = content.split('\n')
-            except Exception:
-                continue
 
-            for pattern in patterns:
-                for line_num, line in enumerate(lines, 1):
-                    if re.search(pattern, line, re.IGNORECASE):
-                        rel_path = os.path.relpath(fpath, REPO_ROOT)
-                        snippet = line.strip()[:60]
-                        return False, f"Found '{pattern}' at {rel_path}:{line_num}: {snippet}"
+def _compile_patterns(patterns: list) -> re.Pattern:
+    """
+    Compile prohibited patterns into a single case-insensitive bytes regex.
+
+    Each pattern becomes one alternative in a named group (p0, p1, ...), so
+    a match can be traced back to the pattern at that index.
+    """
+    return re.compile(
+        '|'.join(f'(?P<p{i}>{pattern})' for i, pattern in enumerate(patterns)).encode('utf-8'),
+        re.IGNORECASE
+    )
+
+
+def _scan_repo_for_patterns(patterns: list, files: list = None,
+                            combined: re.Pattern = None) -> tuple:
+    """
+    Scan repo for prohibited patterns.
+
+    All patterns are joined into a single alternation (one named group
+    per pattern), so each file is searched once over its full contents
+    instead of once per pattern per line.
+
+    Matching over the whole file is broader than the per-line scan it
+    replaced: "." still stops at a line break, but \s can cross one, so
+    "if debug\n:" now counts as "if\s+debug\s*:". Every per-line hit is
+    still found; only such split constructs are newly reported.
+
+    Args:
+        patterns: Prohibited regex patterns (matched case-insensitively)
+        files: (rel_path, content_bytes) inventory from _collect_py_files();
+               collected on demand when not supplied
+        combined: Precompiled _compile_patterns(patterns); compiled on
+                  demand when not supplied
+
+    Returns:
+        (passed, message) tuple
+    """
+    if files is None:
+        files = _collect_py_files()
+
+    if combined is None:
+        combined = _compile_patterns(patterns)
+
+    for rel_path, content in files:
+        match = combined.search(content)
+        if match:
+            pattern = patterns[int(match.lastgroup[1:])]
+            line_num = content.count(b'\n', 0, match.start()) + 1
+            line_start = content.rfind(b'\n', 0, match.start()) + 1
+            line_end = content.find(b'\n', match.start())
+            if line_end == -1:
+                line_end = len(content)
+            snippet = content[line_start:line_end].decode('utf-8', 'replace').strip()[:60]
+            return False, f"Found '{pattern}' at {rel_path}:{line_num}: {snippet}"
 
     return True, "No prohibited patterns found"
 
 
-def check_no_accept_fixtures():
+# ACCEPT fixture patterns (repo-wide)
+ACCEPT_FIXTURE_PATTERNS = [
+    r'accept_fixture',
+    r'ACCEPT_FIXTURE',
+    r'mock.*accept.*proposal',
+    r'fake.*accept.*proposal',
+    r'stub.*accept.*proposal',
+]
+
+ACCEPT_FIXTURE_REGEX = _compile_patterns(ACCEPT_FIXTURE_PATTERNS)
+
+
+def check_no_accept_fixtures(files: list = None):
     """Check that no ACCEPT fixtures exist repo-wide."""
-    prohibited_patterns = [
-        r'accept_fixture',
-        r'ACCEPT_FIXTURE',
-        r'mock.*accept.*proposal',
-        r'fake.*accept.*proposal',
-        r'stub.*accept.*proposal',
-    ]
-    return _scan_repo_for_patterns(prohibited_patterns)
+    return _scan_repo_for_patterns(ACCEPT_FIXTURE_PATTERNS, files, ACCEPT_FIXTURE_REGEX)
+
+
+# Retry loop patterns (repo-wide)
+# These patterns are checked in Python files that are part of runtime
+RETRY_LOOP_PATTERNS = [
+    r'\bretry\s*\(',        # retry function calls
+    r'\bmax_attempts\b',
+    r'\bbackoff\b',
+    r'\btry_again\b',
+    r'\battempt\s*\+=\s*1',
+    r'while.*attempt.*<',
+    r'for.*attempt.*in.*range',
+]
 
+RETRY_LOOP_REGEX = _compile_patterns(RETRY_LOOP_PATTERNS)
 
-def check_no_retry_loops():
+
+def check_no_retry_loops(files: list = None):
     """Check that no retry loops exist in runtime paths."""
-    # These patterns are checked in Python files that are part of runtime
-    prohibited_patterns = [
-        r'\bretry\s*\(',        # retry function calls
-        r'\bmax_attempts\b',
-        r'\bbackoff\b',
-        r'\btry_again\b',
-        r'\battempt\s*\+=\s*1',
-        r'while.*attempt.*<',
-        r'for.*attempt.*in.*range',
-    ]
-    return _scan_repo_for_patterns(prohibited_patterns)
+    return _scan_repo_for_patterns(RETRY_LOOP_PATTERNS, files, RETRY_LOOP_REGEX)
+
+
+# Scoring/ranking/confidence patterns (repo-wide)
+SCORING_RANKING_PATTERNS = [
+    r'\bscore\s*=',         # score assignment
+    r'\bscoring\s*\(',      # scoring function
+    r'\brank\s*=',          # rank assignment
+    r'\branking\s*\(',      # ranking function
+    r'\bconfidence\s*[=<>]', # confidence comparison/assignment
+    r'\bthreshold\s*=',     # threshold assignment
+    r'\.score\b',           # .score attribute
+    r'\.rank\b',            # .rank attribute
+    r'\.confidence\b',      # .confidence attribute
+]
 
+SCORING_RANKING_REGEX = _compile_patterns(SCORING_RANKING_PATTERNS)
 
-def check_no_scoring_ranking():
+
+def check_no_scoring_ranking(files: list = None):
     """Check that no scoring/ranking/confidence keywords exist in runtime paths."""
-    prohibited_patterns = [
-        r'\bscore\s*=',         # score assignment
-        r'\bscoring\s*\(',      # scoring function
-        r'\brank\s*=',          # rank assignment
-        r'\branking\s*\(',      # ranking function
-        r'\bconfidence\s*[=<>]', # confidence comparison/assignment
-        r'\bthreshold\s*=',     # threshold assignment
-        r'\.score\b',           # .score attribute
-        r'\.rank\b',            # .rank attribute
-        r'\.confidence\b',      # .confidence attribute
-    ]
-    return _scan_repo_for_patterns(prohibited_patterns)
+    return _scan_repo_for_patterns(SCORING_RANKING_PATTERNS, files, SCORING_RANKING_REGEX)
+
+
+def _brok_help_text() -> str:
+    """
+    Render ./brok --help in-process.
+
+    ./brok is loaded through the shared in-process runner and main() is
+    called with --help; argparse prints the help text to sys.stdout and
+    exits before any pipeline code runs.
+    """
+    brok_cli = brok_cli_runner.load_brok_cli()
+
+    output = io.StringIO()
+    saved_argv = sys.argv
+    sys.argv = [str(brok_cli_runner.BROK_CLI), '--help']
+    try:
+        with brok_cli_runner.silenced_output(), \
+                contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            brok_cli.main()
+    except SystemExit:
+        pass
+    finally:
+        sys.argv = saved_argv
+
+    return output.getvalue()
 
 
 def check_no_new_cli_flags():
     """Check that no new CLI flags exist beyond --input."""
     allowed_flags = {'--input', '-h', '--help'}
 
-    result = subprocess.run(
-        [sys.executable, BROK_CLI_PATH, '--help'],
-        capture_output=True,
-        text=True
-    )
-
     # Parse help output for flags
-    found_flags = set(re.findall(r'(--[a-z-]+|-[a-z])', result.stdout + result.stderr))
+    found_flags = set(re.findall(r'(--[a-z-]+|-[a-z])', _brok_help_text()))
 
     new_flags = found_flags - allowed_flags
     if new_flags:
@@ -179,35 +265,46 @@ def check_no_env_vars_in_seam():
     for path in SEAM_PATHS:
         if not os.path.isdir(path):
             continue
-        for root, dirs, files in os.walk(path):
-            dirs[:] = [d for d in dirs if d != '__pycache__']
-            for fname in files:
-                if not fname.endswith('.py'):
-                    continue
-                fpath = os.path.join(root, fname)
-                with open(fpath, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    lines = content.split('\n')
-                for pattern in prohibited_patterns:
-                    for line_num, line in enumerate(lines, 1):
-                        if re.search(pattern, line):
-                            rel_path = os.path.relpath(fpath, REPO_ROOT)
-                            return False, f"Found env var pattern '{pattern}' at {rel_path}:{line_num}"
+        for fpath in iter_files(path, {'__pycache__'}):
+            with open(fpath, 'r', encoding='utf-8') as f:
+                content = f.read()
+                lines = content.split('\n')
+            for pattern in prohibited_patterns:
+                for line_num, line in enumerate(lines, 1):
+                    if re.search(pattern, line):
+                        rel_path = os.path.relpath(fpath, REPO_ROOT)
+                        return False, f"Found env var pattern '{pattern}' at {rel_path}:{line_num}"
     return True, "No environment variables in seam code"
 
 
-def check_no_runtime_config():
+# Runtime configurability patterns (repo-wide)
+RUNTIME_CONFIG_PATTERNS = [
+    r'config_file\s*=',
+    r'load_config\(',
+    r'configparser',
+    r'runtime_mode\s*=',
+    r'debug_mode\s*=',
+    r'if\s+debug\s*:',
+    r'if\s+DEBUG\s*:',
+]
+
+RUNTIME_CONFIG_REGEX = _compile_patterns(RUNTIME_CONFIG_PATTERNS)
+
+
+def check_no_runtime_config(files: list = None):
     """Check that no runtime configurability exists repo-wide."""
-    prohibited_patterns = [
-        r'config_file\s*=',
-        r'load_config\(',
-        r'configparser',
-        r'runtime_mode\s*=',
-        r'debug_mode\s*=',
-        r'if\s+debug\s*:',
-        r'if\s+DEBUG\s*:',
-    ]
-    return _scan_repo_for_patterns(prohibited_patterns)
+    return _scan_repo_for_patterns(RUNTIME_CONFIG_PATTERNS, files, RUNTIME_CONFIG_REGEX)
+
+
+# Every repo-wide pattern, for the combined fast-path pass in main()
+REPO_WIDE_PATTERNS = (
+    ACCEPT_FIXTURE_PATTERNS
+    + RETRY_LOOP_PATTERNS
+    + SCORING_RANKING_PATTERNS
+    + RUNTIME_CONFIG_PATTERNS
+)
+
+REPO_WIDE_REGEX = _compile_patterns(REPO_WIDE_PATTERNS)
 
 
 def check_no_os_import_in_seam_provider():
@@ -230,13 +327,26 @@ def check_no_os_import_in_seam_provider():
 
 def main():
     """Run all prohibition checks."""
+    # Walk and read the repo once; repo-wide checks share the inventory
+    files = _collect_py_files()
+
+    # Fast path: one combined pass with every repo-wide pattern. If nothing
+    # matches anywhere, all repo-wide checks pass without their own scans;
+    # any hit falls back to the per-check scans to attribute the failure.
+    repo_wide_clean, _ = _scan_repo_for_patterns(REPO_WIDE_PATTERNS, files, REPO_WIDE_REGEX)
+
+    def repo_wide(check_fn):
+        if repo_wide_clean:
+            return lambda: (True, "No prohibited patterns found")
+        return lambda: check_fn(files)
+
     checks = [
-        ("No ACCEPT fixtures (repo-wide)", check_no_accept_fixtures),
-        ("No retry loops (repo-wide)", check_no_retry_loops),
-        ("No scoring/ranking (repo-wide)", check_no_scoring_ranking),
+        ("No ACCEPT fixtures (repo-wide)", repo_wide(check_no_accept_fixtures)),
+        ("No retry loops (repo-wide)", repo_wide(check_no_retry_loops)),
+        ("No scoring/ranking (repo-wide)", repo_wide(check_no_scoring_ranking)),
         ("No new CLI flags", check_no_new_cli_flags),
         ("No env vars in seam", check_no_env_vars_in_seam),
-        ("No runtime config (repo-wide)", check_no_runtime_config),
+        ("No runtime config (repo-wide)", repo_wide(check_no_runtime_config)),
         ("No os import in seam_provider", check_no_os_import_in_seam_provider),
     ]
 
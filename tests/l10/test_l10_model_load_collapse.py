@@ -14,25 +14,25 @@ Test Cases:
 - C2: Unreadable model file -> _get_llm() returns None
 
 DEPENDENCY: llama-cpp-python (tested with 0.2.90)
-This is a required dependency for these tests. Tests FAIL (not skip) if missing.
+This is a required dependency for these tests. The positive load test FAILS
+(not skips) if it is missing. It is imported on first use, so the native
+extension is only loaded by tests that need it.
 Install via: pip install llama-cpp-python==0.2.90
 """
 
+import contextlib
+import functools
 import os
 import stat
+import struct
 import sys
 import tempfile
-import shutil
-
-# REQUIRED DEPENDENCY: llama-cpp-python (tested with 0.2.90)
-# This import will FAIL if the dependency is not installed.
-# Tests do not skip on missing dependency - they fail.
-from llama_cpp import Llama
+import unittest
+from pathlib import Path
 
 # Setup paths
-_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-_REPO_ROOT = os.path.dirname(os.path.dirname(_SCRIPT_DIR))
-_SRC_DIR = os.path.join(_REPO_ROOT, 'src')
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+_SRC_DIR = str(_REPO_ROOT / 'src')
 
 if _SRC_DIR not in sys.path:
     sys.path.insert(0, _SRC_DIR)
@@ -43,17 +43,83 @@ from artifact_layer.inference_engine import (
     _MODEL_RELATIVE_PATH
 )
 
+# Fixed model path, resolved once for the whole module
+MODEL_PATH = _get_model_path()
+_MODEL_PRESENT = MODEL_PATH.exists()
+
+# GGUF header: 4-byte magic + little-endian uint32 version
+GGUF_HEADER = struct.Struct('<4sI')
+GGUF_KNOWN_VERSIONS = (1, 2, 3)
+
+# Smallest possible GGUF file: magic, version, then uint64 tensor and
+# metadata KV counts. Anything shorter fails gguf_init_from_file().
+GGUF_MIN_SIZE = GGUF_HEADER.size + 16
+
+# Skip markers, evaluated once at import. unittest.skipIf works on plain
+# functions: pytest reports the raised SkipTest as a skip, and main()
+# counts it as skipped.
+requires_model = unittest.skipIf(not _MODEL_PRESENT, f"Model file not found at {MODEL_PATH}")
+requires_posix_permissions = unittest.skipIf(sys.platform == 'win32', "Test skipped on Windows")
+
 
 # =============================================================================
-# HELPER: Reset module state between tests
+# HELPERS: Shared model load, module state reset
 # =============================================================================
 
+@functools.lru_cache(maxsize=1)
+def llama_cls():
+    """
+    Import and return llama_cpp.Llama on first use.
+
+    REQUIRED DEPENDENCY: llama-cpp-python (tested with 0.2.90). The
+    ImportError is not caught: tests that need Llama fail, not skip.
+    """
+    from llama_cpp import Llama
+    return Llama
+
+
+@functools.lru_cache(maxsize=1)
+def shared_llama():
+    """
+    Load the vendored model with llama-cpp-python once per process.
+
+    Loading (GGUF mmap + metadata parse) dominates the cost of these tests,
+    so every test that needs a real Llama instance shares this one. The
+    load is lazy: tests that never need the model never pay for it.
+    """
+    # Load-only: no test runs inference, so the KV cache is minimized
+    return llama_cls()(
+        model_path=str(MODEL_PATH),
+        n_ctx=8,
+        n_threads=2,
+        verbose=False
+    )
+
+
 def reset_llm_instance():
     """Reset the module-level _llm_instance to None."""
     import artifact_layer.inference_engine as ie
     ie._llm_instance = None
 
 
+@contextlib.contextmanager
+def model_path_patched(model_path):
+    """
+    Point _get_model_path() at model_path for the duration of the block.
+
+    _get_llm() looks _get_model_path up as a module global, so replacing it
+    on the module is enough. The LLM instance is reset on exit.
+    """
+    import artifact_layer.inference_engine as ie
+    original = ie._get_model_path
+    ie._get_model_path = lambda: model_path
+    try:
+        yield
+    finally:
+        ie._get_model_path = original
+        reset_llm_instance()
+
+
 # =============================================================================
 # TEST: Model path resolution
 # =============================================================================
@@ -76,26 +142,34 @@ def test_model_path_resolution():
 # TEST: Model file is valid GGUF
 # =============================================================================
 
+@requires_model
 def test_model_file_is_valid_gguf():
     """
-    Verify that model.bin is a valid GGUF file by checking magic bytes.
+    Verify that model.bin is a valid GGUF file by checking its header.
 
-    GGUF files start with the magic bytes: 0x47 0x47 0x55 0x46 ("GGUF")
+    GGUF files start with the magic bytes: 0x47 0x47 0x55 0x46 ("GGUF"),
+    followed by a little-endian uint32 format version. Only the 8-byte
+    header is read; this is the same check llama.cpp's gguf_init_from_file
+    makes before loading anything.
     """
-    model_path = _get_model_path()
-
-    if not model_path.exists():
-        print(f"[SKIP] Model file not found at {model_path}")
-        return
+    model_path = MODEL_PATH
 
     with open(model_path, 'rb') as f:
-        magic = f.read(4)
+        header = f.read(GGUF_HEADER.size)
+
+    assert len(header) == GGUF_HEADER.size, \
+        f"Model file too short for a GGUF header ({len(header)} bytes)"
+
+    magic, version = GGUF_HEADER.unpack(header)
 
     expected_magic = b'GGUF'
     assert magic == expected_magic, \
         f"Model file should have GGUF magic bytes, got {magic!r}"
 
-    print(f"[PASS] Model file is valid GGUF (magic bytes: {magic!r})")
+    assert version in GGUF_KNOWN_VERSIONS, \
+        f"Unknown GGUF version {version} (expected one of {GGUF_KNOWN_VERSIONS})"
+
+    print(f"[PASS] Model file is valid GGUF (magic bytes: {magic!r}, version {version})")
 
 
 # =============================================================================
@@ -106,85 +180,61 @@ def test_c1_missing_model_returns_none():
     """
     C1: Missing model file causes _get_llm() to return None.
 
-    This test temporarily moves the model file, calls _get_llm(),
-    and verifies it returns None. The file is restored in finally block.
+    This test points _get_model_path() at a path inside an empty temp
+    directory, calls _get_llm(), and verifies it returns None. The
+    vendored model file itself is never moved.
     """
     reset_llm_instance()
-    model_path = _get_model_path()
-    backup_path = model_path.with_suffix('.bin.backup')
-
-    if not model_path.exists():
-        print(f"[SKIP] Model file not found at {model_path}")
-        return
-
-    try:
-        # Move the model file to create "missing" condition
-        shutil.move(str(model_path), str(backup_path))
 
-        # Verify file is actually missing
-        assert not model_path.exists(), "Model file should be missing for test"
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        missing_path = Path(tmp_dir) / 'model.bin'
 
-        # Call _get_llm() - should return None due to missing file
-        result = _get_llm()
+        with model_path_patched(missing_path):
+            # Verify file is actually missing
+            assert not missing_path.exists(), "Model file should be missing for test"
 
-        assert result is None, \
-            f"_get_llm() should return None when model is missing, got {type(result)}"
+            # Call _get_llm() - should return None due to missing file
+            result = _get_llm()
 
-        print("[PASS] C1: Missing model file -> _get_llm() returns None")
+    assert result is None, \
+        f"_get_llm() should return None when model is missing, got {type(result)}"
 
-    finally:
-        # Restore the model file
-        reset_llm_instance()
-        if backup_path.exists():
-            shutil.move(str(backup_path), str(model_path))
+    print("[PASS] C1: Missing model file -> _get_llm() returns None")
 
 
 # =============================================================================
 # TEST C2: Unreadable model file -> _get_llm() returns None
 # =============================================================================
 
+@requires_posix_permissions
 def test_c2_unreadable_model_returns_none():
     """
     C2: Unreadable model file causes _get_llm() to return None.
 
-    This test temporarily removes read permissions from the model file,
-    calls _get_llm(), and verifies it returns None. Permissions are
-    restored in finally block.
+    This test points _get_model_path() at a write-only temp file that
+    starts with the GGUF magic bytes, calls _get_llm(), and verifies it
+    returns None. The vendored model's permissions are never touched.
 
-    Note: This test may not work on all platforms (e.g., Windows) or
-    when running as root. It is skipped in those cases.
+    Note: chmod-based unreadability does not hold on Windows (skipped
+    there) or when running as root.
     """
     reset_llm_instance()
-    model_path = _get_model_path()
-
-    if not model_path.exists():
-        print(f"[SKIP] Model file not found at {model_path}")
-        return
 
-    # Skip on Windows (chmod doesn't work the same way)
-    if sys.platform == 'win32':
-        print("[SKIP] C2: Test skipped on Windows")
-        return
-
-    # Get original permissions
-    original_mode = os.stat(model_path).st_mode
-
-    try:
-        # Remove read permissions (keep write to restore later)
-        os.chmod(model_path, stat.S_IWUSR)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        unreadable_path = Path(tmp_dir) / 'model.bin'
+        unreadable_path.write_bytes(b'GGUF')
 
-        # Call _get_llm() - should return None due to unreadable file
-        result = _get_llm()
+        # Remove read permissions (keep write so the temp dir can be cleaned)
+        os.chmod(unreadable_path, stat.S_IWUSR)
 
-        assert result is None, \
-            f"_get_llm() should return None when model is unreadable, got {type(result)}"
+        with model_path_patched(unreadable_path):
+            # Call _get_llm() - should return None due to unreadable file
+            result = _get_llm()
 
-        print("[PASS] C2: Unreadable model file -> _get_llm() returns None")
+    assert result is None, \
+        f"_get_llm() should return None when model is unreadable, got {type(result)}"
 
-    finally:
-        # Restore original permissions
-        reset_llm_instance()
-        os.chmod(model_path, original_mode)
+    print("[PASS] C2: Unreadable model file -> _get_llm() returns None")
 
 
 # =============================================================================
@@ -203,28 +253,28 @@ def test_positive_model_load():
     - The model file is missing
     - The model cannot be loaded
     """
-    reset_llm_instance()
-    model_path = _get_model_path()
+    model_path = MODEL_PATH
 
     assert model_path.exists(), f"Model file must exist at {model_path}"
 
+    # A file too short to hold a GGUF preamble cannot load; fail here
+    # rather than after initialising the llama.cpp backend.
+    model_size = model_path.stat().st_size
+    assert model_size >= GGUF_MIN_SIZE, \
+        f"Model file too small for GGUF ({model_size} bytes, need {GGUF_MIN_SIZE})"
+
     # Attempt to load the model - this is the actual positive test
-    # No inference is performed - this test only proves load capability
-    llm = Llama(
-        model_path=str(model_path),
-        n_ctx=256,
-        n_threads=2,
-        verbose=False
-    )
+    # No inference is performed - this test only proves load capability.
+    # Llama() is called directly (not via _get_llm()), so inference_engine's
+    # _llm_instance is untouched and needs no reset.
+    llm = shared_llama()
 
     # Verify we got a Llama instance
     assert llm is not None, "Llama() should return an instance"
-    assert isinstance(llm, Llama), f"Expected Llama instance, got {type(llm)}"
+    assert isinstance(llm, llama_cls()), f"Expected Llama instance, got {type(llm)}"
 
     print("[PASS] Positive model load: llama-cpp-python successfully loaded GGUF")
 
-    reset_llm_instance()
-
 
 # =============================================================================
 # TEST: _get_llm() returns None in Prompt 1 (inference not wired)
@@ -240,10 +290,13 @@ def test_get_llm_returns_none_prompt1():
 
     Load capability is proven by test_positive_model_load() which calls
     Llama() directly.
+
+    _get_llm() discards the instance on every path in Prompt 1, so only
+    the reset before the call (against state left by other tests) is needed.
     """
     reset_llm_instance()
 
-    model_path = _get_model_path()
+    model_path = MODEL_PATH
     assert model_path.exists(), f"Model file must exist at {model_path}"
 
     # Call _get_llm() - returns None in Prompt 1 (inference not wired)
@@ -253,9 +306,6 @@ def test_get_llm_returns_none_prompt1():
 
     print("[PASS] _get_llm() returns None (Prompt 1 - inference not wired)")
 
-    # Clean up
-    reset_llm_instance()
-
 
 # =============================================================================
 # MAIN
@@ -285,6 +335,9 @@ def main():
         try:
             test_fn()
             passed += 1
+        except unittest.SkipTest as e:
+            print(f"[SKIP] {name}: {e}")
+            skipped += 1
         except AssertionError as e:
             print(f"[FAIL] {name}: {e}")
             failed += 1
@@ -294,7 +347,7 @@ def main():
 
     print()
     print("=" * 70)
-    print(f"Results: {passed} passed, {failed} failed")
+    print(f"Results: {passed} passed, {failed} failed, {skipped} skipped")
     print("=" * 70)
 
     return 0 if failed == 0 else 1
@@ -6,7 +6,8 @@ Demonstrates that LLM engine failures collapse to REJECT through the real
 pipeline, not just in isolated unit tests.
 
 Test categories:
-1. Empty/malformed input -> REJECT
+1. Empty/malformed/unmapped input -> REJECT (in-process pipeline, plus one
+   ./brok subprocess smoke test)
 2. Seam-level failure injection -> REJECT (via monkeypatch)
 
 All failures must:
@@ -18,11 +19,14 @@ Note: The offline nondeterministic engine does not require API keys or
 external services, so API unavailability is not a failure mode.
 """
 
+import atexit
+import contextlib
+import functools
 import os
 import subprocess
 import sys
 import tempfile
-import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 BROK_CLI = os.path.join(REPO_ROOT, 'brok')
@@ -33,56 +37,100 @@ sys.path.insert(0, os.path.join(REPO_ROOT, 'm3', 'src'))
 sys.path.insert(0, os.path.join(REPO_ROOT, 'artifact', 'src'))
 
 
-def test_empty_input_produces_reject():
-    """Test that empty input produces REJECT via real pipeline."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-        f.write("")
-        input_path = f.name
+# One scratch directory for every test in this module, removed at exit
+_SCRATCH = contextlib.ExitStack()
+atexit.register(_SCRATCH.close)
 
-    try:
-        result = subprocess.run(
-            [sys.executable, BROK_CLI, '--input', input_path],
-            capture_output=True,
-            text=True,
-            cwd=REPO_ROOT
-        )
 
-        if result.returncode != 0:
-            return False, f"Expected exit code 0, got {result.returncode}"
+@functools.lru_cache(maxsize=None)
+def _scratch_root() -> str:
+    """Create the shared scratch directory on first use."""
+    return _SCRATCH.enter_context(tempfile.TemporaryDirectory(prefix='l2_failure_collapse_'))
 
-        if 'decision=REJECT' not in result.stdout:
-            return False, "Expected 'decision=REJECT' in output"
 
-        return True, "Empty input -> REJECT (exit 0)"
+def _write_input(name: str, content: bytes) -> str:
+    """Write an input file into the shared scratch directory; return its path."""
+    input_path = os.path.join(_scratch_root(), f"{name}.txt")
+    with open(input_path, 'wb') as f:
+        f.write(content)
+    return input_path
 
-    finally:
-        os.unlink(input_path)
+
+def _run_pipeline_in_process(input_bytes: bytes, run_id: str) -> dict:
+    """
+    Helper: Run input through the real pipeline in-process.
+
+    Invokes the same path as the CLI (run_proposal_generator() through
+    whatever seam_provider.acquire_proposal_set currently is, then
+    build_and_save_artifact()) without paying for a fresh interpreter and
+    re-import per test. Input and artifacts go to the shared scratch
+    directory, keyed by run_id.
+
+    Returns the artifact dict built by the pipeline.
+    """
+    from orchestrator import run_proposal_generator, build_and_save_artifact, get_input_ref
+
+    scratch = _scratch_root()
+    input_path = _write_input(run_id, input_bytes)
+
+    proposal_set, proposal_set_path, error = run_proposal_generator(
+        input_path, run_id, scratch
+    )
+
+    input_ref = get_input_ref(input_path, scratch)
+    proposal_set_ref = os.path.relpath(proposal_set_path, scratch)
+
+    artifact, artifact_path, error = build_and_save_artifact(
+        proposal_set, run_id, input_ref, proposal_set_ref, scratch
+    )
+
+    return artifact
+
+
+def test_empty_input_produces_reject():
+    """Test that empty input produces REJECT via real pipeline."""
+    artifact = _run_pipeline_in_process(b"", "test_empty_input")
+
+    decision = artifact.get("decision")
+    if decision != "REJECT":
+        return False, f"Expected decision=REJECT, got {decision}"
+
+    return True, "Empty input -> REJECT"
 
 
 def test_malformed_utf8_produces_reject():
     """Test that malformed UTF-8 input produces REJECT."""
-    with tempfile.NamedTemporaryFile(mode='wb', suffix='.txt', delete=False) as f:
-        f.write(b'\xff\xfe\x00\x01\x80\x81')
-        input_path = f.name
+    artifact = _run_pipeline_in_process(b'\xff\xfe\x00\x01\x80\x81', "test_malformed_utf8")
 
-    try:
-        result = subprocess.run(
-            [sys.executable, BROK_CLI, '--input', input_path],
-            capture_output=True,
-            text=True,
-            cwd=REPO_ROOT
-        )
+    decision = artifact.get("decision")
+    if decision != "REJECT":
+        return False, f"Expected decision=REJECT, got {decision}"
 
-        if result.returncode != 0:
-            return False, f"Expected exit code 0, got {result.returncode}"
+    return True, "Malformed UTF-8 -> REJECT"
 
-        if 'decision=REJECT' not in result.stdout:
-            return False, "Expected 'decision=REJECT' in output"
 
-        return True, "Malformed UTF-8 -> REJECT (exit 0)"
+def test_cli_subprocess_smoke():
+    """
+    Smoke test: ./brok run as a separate process exits 0 with REJECT.
 
-    finally:
-        os.unlink(input_path)
+    The other input tests run the pipeline in-process; this one keeps
+    coverage of the CLI's process boundary and exit code.
+    """
+    input_path = _write_input("cli_subprocess_smoke", b"")
+
+    result = subprocess.run(
+        [sys.executable, BROK_CLI, '--input', input_path],
+        capture_output=True,
+        cwd=REPO_ROOT
+    )
+
+    if result.returncode != 0:
+        return False, f"Expected exit code 0, got {result.returncode}"
+
+    if b'decision=REJECT' not in result.stdout:
+        return False, "Expected 'decision=REJECT' in output"
+
+    return True, "CLI empty input -> REJECT (exit 0)"
 
 
 def test_seam_exception_produces_reject():
@@ -93,16 +141,6 @@ def test_seam_exception_produces_reject():
     then verifies the downstream artifact decision is REJECT.
     """
     from artifact_layer import seam_provider
-    from orchestrator import run_proposal_generator, build_and_save_artifact, get_input_ref
-
-    # Create temp input file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-        f.write("test input for seam exception")
-        input_path = f.name
-
-    # Create temp run directory
-    run_id = "test_seam_exception"
-    temp_artifacts = tempfile.mkdtemp()
 
     # Save original function
     original_acquire = seam_provider.acquire_proposal_set
@@ -114,18 +152,9 @@ def test_seam_exception_produces_reject():
         # Apply the patch
         seam_provider.acquire_proposal_set = raising_seam
 
-        # Run proposal generator (uses patched seam)
-        proposal_set, proposal_set_path, error = run_proposal_generator(
-            input_path, run_id, temp_artifacts
-        )
-
-        # Get input ref
-        input_ref = get_input_ref(input_path, temp_artifacts)
-        proposal_set_ref = os.path.relpath(proposal_set_path, temp_artifacts)
-
-        # Build artifact (uses real builder, not mocked)
-        artifact, artifact_path, error = build_and_save_artifact(
-            proposal_set, run_id, input_ref, proposal_set_ref, temp_artifacts
+        # Run the pipeline (uses patched seam, real artifact builder)
+        artifact = _run_pipeline_in_process(
+            b"test input for seam exception", "test_seam_exception"
         )
 
         # Assert downstream REJECT
@@ -147,9 +176,6 @@ def test_seam_exception_produces_reject():
     finally:
         # Restore original
         seam_provider.acquire_proposal_set = original_acquire
-        # Cleanup
-        os.unlink(input_path)
-        shutil.rmtree(temp_artifacts, ignore_errors=True)
 
 
 def test_seam_returns_empty_produces_reject():
@@ -157,16 +183,6 @@ def test_seam_returns_empty_produces_reject():
     Test that when seam returns empty bytes, it produces REJECT.
     """
     from artifact_layer import seam_provider
-    from orchestrator import run_proposal_generator, build_and_save_artifact, get_input_ref
-
-    # Create temp input file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-        f.write("test input for empty return")
-        input_path = f.name
-
-    # Create temp run directory
-    run_id = "test_seam_empty"
-    temp_artifacts = tempfile.mkdtemp()
 
     # Save original function
     original_acquire = seam_provider.acquire_proposal_set
@@ -178,18 +194,9 @@ def test_seam_returns_empty_produces_reject():
         # Apply the patch
         seam_provider.acquire_proposal_set = empty_seam
 
-        # Run proposal generator (uses patched seam)
-        proposal_set, proposal_set_path, error = run_proposal_generator(
-            input_path, run_id, temp_artifacts
-        )
-
-        # Get input ref
-        input_ref = get_input_ref(input_path, temp_artifacts)
-        proposal_set_ref = os.path.relpath(proposal_set_path, temp_artifacts)
-
-        # Build artifact (uses real builder, not mocked)
-        artifact, artifact_path, error = build_and_save_artifact(
-            proposal_set, run_id, input_ref, proposal_set_ref, temp_artifacts
+        # Run the pipeline (uses patched seam, real artifact builder)
+        artifact = _run_pipeline_in_process(
+            b"test input for empty return", "test_seam_empty"
         )
 
         # Assert downstream REJECT
@@ -202,9 +209,6 @@ def test_seam_returns_empty_produces_reject():
     finally:
         # Restore original
         seam_provider.acquire_proposal_set = original_acquire
-        # Cleanup
-        os.unlink(input_path)
-        shutil.rmtree(temp_artifacts, ignore_errors=True)
 
 
 def test_unmapped_input_produces_reject():
@@ -213,29 +217,22 @@ def test_unmapped_input_produces_reject():
 
     This tests the offline engine's behavior when it cannot interpret the input.
     """
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-        # Input that doesn't match any known patterns
-        f.write("xyzzy foobarbaz quxquux")
-        input_path = f.name
-
-    try:
-        result = subprocess.run(
-            [sys.executable, BROK_CLI, '--input', input_path],
-            capture_output=True,
-            text=True,
-            cwd=REPO_ROOT
-        )
+    # Input that doesn't match any known patterns
+    artifact = _run_pipeline_in_process(b"xyzzy foobarbaz quxquux", "test_unmapped_input")
 
-        if result.returncode != 0:
-            return False, f"Expected exit code 0, got {result.returncode}"
+    decision = artifact.get("decision")
+    if decision != "REJECT":
+        return False, f"Expected decision=REJECT, got {decision}"
 
-        if 'decision=REJECT' not in result.stdout:
-            return False, "Expected 'decision=REJECT' in output"
+    return True, "Unmapped input -> REJECT"
 
-        return True, "Unmapped input -> REJECT (exit 0)"
 
-    finally:
-        os.unlink(input_path)
+def _run_test(test_fn) -> tuple:
+    """Run one test function; an unexpected exception counts as a failure."""
+    try:
+        return test_fn()
+    except Exception as e:
+        return False, f"Exception: {type(e).__name__}: {e}"
 
 
 def main():
@@ -244,20 +241,29 @@ def main():
         ("Empty input -> REJECT", test_empty_input_produces_reject),
         ("Malformed UTF-8 -> REJECT", test_malformed_utf8_produces_reject),
         ("Unmapped input -> REJECT", test_unmapped_input_produces_reject),
+        ("CLI subprocess smoke -> REJECT", test_cli_subprocess_smoke),
         ("Seam exception -> REJECT", test_seam_exception_produces_reject),
         ("Seam returns b'' -> REJECT", test_seam_returns_empty_produces_reject),
     ]
 
+    # The CLI smoke test only waits on a subprocess, so it runs on a worker
+    # thread alongside the rest. The in-process tests share orchestrator and
+    # seam_provider module state (two of them patch the seam), so they stay
+    # sequential on this thread. Results are reported in the order listed.
+    _scratch_root()  # create it here, before the worker thread can race for it
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        smoke = executor.submit(_run_test, test_cli_subprocess_smoke)
+        outcomes = {
+            test_fn: _run_test(test_fn)
+            for _, test_fn in tests if test_fn is not test_cli_subprocess_smoke
+        }
+        outcomes[test_cli_subprocess_smoke] = smoke.result()
+
     all_passed = True
     results = []
 
     for name, test_fn in tests:
-        try:
-            passed, message = test_fn()
-        except Exception as e:
-            passed = False
-            message = f"Exception: {type(e).__name__}: {e}"
-
+        passed, message = outcomes[test_fn]
         status = "PASS" if passed else "FAIL"
         results.append((name, status, message))
         if not passed:
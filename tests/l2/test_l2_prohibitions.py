@@ -14,13 +14,22 @@ Prohibitions checked:
 6. No ACCEPT fixtures
 """
 
+import contextlib
+import functools
+import io
 import os
 import re
-import subprocess
 import sys
 
 REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-BROK_CLI_PATH = os.path.join(REPO_ROOT, 'brok')
+
+# Shared test helpers live in tests/
+_TESTS_PATH = os.path.join(REPO_ROOT, 'tests')
+if _TESTS_PATH not in sys.path:
+    sys.path.append(_TESTS_PATH)
+
+import brok_cli_runner
+from repo_files import iter_files
 
 # Directories to exclude from scans
 EXCLUDED_DIRS = {
@@ -39,64 +48,145 @@ EXCLUDED_DIRS = {
 }
 
 
+# Patterns used by the single-file checks, compiled once
+_FLAG_RE = re.compile(r'(--[a-z-]+|-[a-z])')
+_ENV_GET_ENGINE_RE = re.compile(r'os\.environ\.get\(["\'].*ENGINE', re.IGNORECASE)
+_GETENV_ENGINE_RE = re.compile(r'os\.getenv\(["\'].*ENGINE', re.IGNORECASE)
+_IF_ENVIRON_RE = re.compile(r'if.*os\.environ')
+_ACQUIRE_CALL_RE = re.compile(r'acquire_proposal_set\s*\(')
+
+# Multi-component exclusions, as absolute path prefixes. Single-name
+# entries are pruned by basename during the walk. No trailing separator:
+# like the substring match this replaced, 'tests/l1' also covers tests/l10.
+_EXCLUDED_PREFIXES = tuple(
+    os.path.join(REPO_ROOT, *excluded.split('/'))
+    for excluded in sorted(EXCLUDED_DIRS) if '/' in excluded
+)
+
+
 def _should_skip_path(path: str) -> bool:
     """Check if path should be skipped based on exclusion rules."""
-    rel_path = os.path.relpath(path, REPO_ROOT)
-    rel_path_normalized = rel_path.replace(os.sep, '/')
-    parts = rel_path.split(os.sep)
-    for part in parts:
-        if part in EXCLUDED_DIRS:
-            return True
-    for excluded in ['docs/migration/evidence', 'tests/l1', 'tests/l2']:
-        if excluded in rel_path_normalized:
-            return True
-    return False
-
-
-def _scan_repo_for_patterns(patterns: list, file_ext: str = '.py') -> tuple:
-    """Scan repo for prohibited patterns."""
-    for root, dirs, files in os.walk(REPO_ROOT):
-        dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS]
-
-        if _should_skip_path(root):
+    return path.startswith(_EXCLUDED_PREFIXES)
+
+
+def _collect_py_files(file_ext: str = '.py') -> list:
+    """
+    Walk the repo once and read every file subject to repo-wide scans.
+
+    Files are read as raw bytes; nothing is decoded unless a prohibited
+    pattern is found and a snippet has to be reported.
+
+    Returns:
+        List of (rel_path, content_bytes) tuples, in walk order.
+    """
+    collected = []
+    for fpath in iter_files(REPO_ROOT, EXCLUDED_DIRS, file_ext):
+        if _should_skip_path(fpath):
             continue
 
-        for fname in files:
-            if not fname.endswith(file_ext):
-                continue
-            fpath = os.path.join(root, fname)
+        try:
+            with open(fpath, 'rb') as f:
+                content = f.read()
+        except Exception:
+            continue
 
-            if _should_skip_path(fpath):
-                continue
+        collected.append((os.path.relpath(fpath, REPO_ROOT), content))
 
-            try:
-                with open(fpath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    lines = content.split('\n')
-            except Exception:
-                continue
+    return collected
 
-            for pattern in patterns:
-                for line_num, line in enumerate(lines, 1):
-                    if re.search(pattern, line, re.IGNORECASE):
-                        rel_path = os.path.relpath(fpath, REPO_ROOT)
-                        snippet = line.strip()[:60]
-                        return False, f"Found '{pattern}' at {rel_path}:{line_num}: {snippet}"
+
+def _scan_repo_for_patterns(patterns: list, files: list = None) -> tuple:
+    """
+    Scan repo for prohibited patterns.
+
+    All patterns are joined into one alternation with a named group per
+    pattern (p0, p1, ...) and searched over each file's whole content, so
+    the regex engine does the scanning instead of a per-line Python loop;
+    the group that matched names the pattern to report. Line number and
+    snippet are only computed for a hit.
+
+    Args:
+        patterns: Prohibited regex patterns (matched case-insensitively)
+        files: (rel_path, content_bytes) inventory from _collect_py_files();
+               collected on demand when not supplied
+    """
+    if files is None:
+        files = _collect_py_files()
+
+    combined = re.compile(
+        '|'.join(f'(?P<p{i}>{pattern})' for i, pattern in enumerate(patterns)).encode('utf-8'),
+        re.IGNORECASE
+    )
+
+    for rel_path, content in files:
+        match = combined.search(content)
+        if match:
+            pattern = patterns[int(match.lastgroup[1:])]
+            start = match.start()
+            line_num = content.count(b'\n', 0, start) + 1
+            line_end = content.find(b'\n', start)
+            if line_end == -1:
+                line_end = len(content)
+            line = content[content.rfind(b'\n', 0, start) + 1:line_end]
+            snippet = line.decode('utf-8', 'replace').strip()[:60]
+            return False, f"Found '{pattern}' at {rel_path}:{line_num}: {snippet}"
 
     return True, "No prohibited patterns found"
 
 
+@functools.lru_cache(maxsize=None)
+def _read(path: str) -> str:
+    """Read a source file once; several checks inspect the same file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def _compile_patterns(patterns: list, flags: int = 0) -> re.Pattern:
+    """
+    Compile prohibited patterns into a single regex.
+
+    Each pattern becomes one alternative in a named group (p0, p1, ...), so
+    a match can be traced back to the pattern at that index.
+    """
+    return re.compile('|'.join(f'(?P<p{i}>{pattern})' for i, pattern in enumerate(patterns)), flags)
+
+
+def _find_prohibited(patterns: list, regex: re.Pattern, content: str):
+    """Return the pattern behind the first match of regex in content, or None."""
+    match = regex.search(content)
+    return patterns[int(match.lastgroup[1:])] if match else None
+
+
+def _brok_help_text() -> str:
+    """
+    Render ./brok --help in-process.
+
+    ./brok is loaded through the shared in-process runner and main() is
+    called with --help; argparse prints the help text to sys.stdout and
+    exits before any pipeline code runs.
+    """
+    brok_cli = brok_cli_runner.load_brok_cli()
+
+    output = io.StringIO()
+    saved_argv = sys.argv
+    sys.argv = [str(brok_cli_runner.BROK_CLI), '--help']
+    try:
+        with brok_cli_runner.silenced_output(), \
+                contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            brok_cli.main()
+    except SystemExit:
+        pass
+    finally:
+        sys.argv = saved_argv
+
+    return output.getvalue()
+
+
 def check_no_new_cli_flags():
     """Check that no new CLI flags exist beyond --input."""
     allowed_flags = {'--input', '-h', '--help'}
 
-    result = subprocess.run(
-        [sys.executable, BROK_CLI_PATH, '--help'],
-        capture_output=True,
-        text=True
-    )
-
-    found_flags = set(re.findall(r'(--[a-z-]+|-[a-z])', result.stdout + result.stderr))
+    found_flags = set(_FLAG_RE.findall(_brok_help_text()))
     new_flags = found_flags - allowed_flags
 
     if new_flags:
@@ -116,18 +206,17 @@ def check_no_env_config_in_engine_selection():
     if not os.path.isfile(engine_binding):
         return False, "engine_binding.py not found"
 
-    with open(engine_binding, 'r', encoding='utf-8') as f:
-        content = f.read()
+    content = _read(engine_binding)
 
     # Prohibited: using env vars to SELECT which engine to use
-    if re.search(r'os\.environ\.get\(["\'].*ENGINE', content, re.IGNORECASE):
+    if _ENV_GET_ENGINE_RE.search(content):
         return False, "Found environment variable controlling engine selection"
 
-    if re.search(r'os\.getenv\(["\'].*ENGINE', content, re.IGNORECASE):
+    if _GETENV_ENGINE_RE.search(content):
         return False, "Found environment variable controlling engine selection"
 
     # Check for conditional engine selection based on env
-    if re.search(r'if.*os\.environ', content):
+    if _IF_ENVIRON_RE.search(content):
         # Allow API key checks for auth, but not engine selection
         lines = content.split('\n')
         for i, line in enumerate(lines):
@@ -151,17 +240,16 @@ def check_single_seam_call():
     if not os.path.isfile(orchestrator):
         return False, "orchestrator.py not found"
 
-    with open(orchestrator, 'r', encoding='utf-8') as f:
-        content = f.read()
+    content = _read(orchestrator)
 
     # Count calls to acquire_proposal_set
-    calls = re.findall(r'acquire_proposal_set\s*\(', content)
+    call_count = sum(1 for _ in _ACQUIRE_CALL_RE.finditer(content))
 
-    if len(calls) == 0:
+    if call_count == 0:
         return False, "acquire_proposal_set not called in orchestrator"
 
-    if len(calls) > 1:
-        return False, f"acquire_proposal_set called {len(calls)} times (expected 1)"
+    if call_count > 1:
+        return False, f"acquire_proposal_set called {call_count} times (expected 1)"
 
     # Check for retry patterns around the call
     retry_patterns = [
@@ -177,6 +265,21 @@ def check_single_seam_call():
     return True, "acquire_proposal_set called exactly once, no retries"
 
 
+LLM_RETRY_PATTERNS = [
+    r'\bretry\s*\(',
+    r'\bmax_attempts\b',
+    r'\bbackoff\b',
+    r'\btry_again\b',
+    r'\battempt\s*\+=\s*1',
+    r'while.*attempt.*<',
+    r'for.*attempt.*in.*range',
+    r'tenacity',
+    r'retrying',
+]
+
+LLM_RETRY_REGEX = _compile_patterns(LLM_RETRY_PATTERNS, re.IGNORECASE)
+
+
 def check_no_retries_in_llm_engine():
     """Check that LLM engine has no retry/backoff logic."""
     llm_engine = os.path.join(REPO_ROOT, 'src', 'artifact_layer', 'llm_engine.py')
@@ -184,28 +287,24 @@ def check_no_retries_in_llm_engine():
     if not os.path.isfile(llm_engine):
         return False, "llm_engine.py not found"
 
-    with open(llm_engine, 'r', encoding='utf-8') as f:
-        content = f.read()
+    content = _read(llm_engine)
 
-    retry_patterns = [
-        r'\bretry\s*\(',
-        r'\bmax_attempts\b',
-        r'\bbackoff\b',
-        r'\btry_again\b',
-        r'\battempt\s*\+=\s*1',
-        r'while.*attempt.*<',
-        r'for.*attempt.*in.*range',
-        r'tenacity',
-        r'retrying',
-    ]
-
-    for pattern in retry_patterns:
-        if re.search(pattern, content, re.IGNORECASE):
-            return False, f"Found retry pattern in LLM engine: {pattern}"
+    pattern = _find_prohibited(LLM_RETRY_PATTERNS, LLM_RETRY_REGEX, content)
+    if pattern:
+        return False, f"Found retry pattern in LLM engine: {pattern}"
 
     return True, "No retry/backoff patterns in LLM engine"
 
 
+LLM_ENV_PATTERNS = [
+    r'os\.environ',
+    r'os\.getenv',
+    r'getenv\s*\(',
+]
+
+LLM_ENV_REGEX = _compile_patterns(LLM_ENV_PATTERNS)
+
+
 def check_no_env_vars_in_llm_engine():
     """Check that LLM engine does not use environment variables."""
     llm_engine = os.path.join(REPO_ROOT, 'src', 'artifact_layer', 'llm_engine.py')
@@ -213,23 +312,30 @@ def check_no_env_vars_in_llm_engine():
     if not os.path.isfile(llm_engine):
         return False, "llm_engine.py not found"
 
-    with open(llm_engine, 'r', encoding='utf-8') as f:
-        content = f.read()
+    content = _read(llm_engine)
 
     # Check for any env var access
-    env_patterns = [
-        r'os\.environ',
-        r'os\.getenv',
-        r'getenv\s*\(',
-    ]
-
-    for pattern in env_patterns:
-        if re.search(pattern, content):
-            return False, f"Found env var access in LLM engine: {pattern}"
+    pattern = _find_prohibited(LLM_ENV_PATTERNS, LLM_ENV_REGEX, content)
+    if pattern:
+        return False, f"Found env var access in LLM engine: {pattern}"
 
     return True, "No environment variables in LLM engine"
 
 
+LLM_NETWORK_PATTERNS = [
+    r'import requests',
+    r'import httpx',
+    r'import urllib',
+    r'import http\.client',
+    r'import anthropic',
+    r'import openai',
+    r'\.get\s*\(\s*["\']http',
+    r'\.post\s*\(\s*["\']http',
+]
+
+LLM_NETWORK_REGEX = _compile_patterns(LLM_NETWORK_PATTERNS, re.IGNORECASE)
+
+
 def check_no_network_in_llm_engine():
     """Check that LLM engine does not make network calls."""
     llm_engine = os.path.join(REPO_ROOT, 'src', 'artifact_layer', 'llm_engine.py')
@@ -237,29 +343,17 @@ def check_no_network_in_llm_engine():
     if not os.path.isfile(llm_engine):
         return False, "llm_engine.py not found"
 
-    with open(llm_engine, 'r', encoding='utf-8') as f:
-        content = f.read()
+    content = _read(llm_engine)
 
     # Check for network-related imports/calls
-    network_patterns = [
-        r'import requests',
-        r'import httpx',
-        r'import urllib',
-        r'import http\.client',
-        r'import anthropic',
-        r'import openai',
-        r'\.get\s*\(\s*["\']http',
-        r'\.post\s*\(\s*["\']http',
-    ]
-
-    for pattern in network_patterns:
-        if re.search(pattern, content, re.IGNORECASE):
-            return False, f"Found network pattern in LLM engine: {pattern}"
+    pattern = _find_prohibited(LLM_NETWORK_PATTERNS, LLM_NETWORK_REGEX, content)
+    if pattern:
+        return False, f"Found network pattern in LLM engine: {pattern}"
 
     return True, "No network calls in LLM engine"
 
 
-def check_no_scoring_ranking():
+def check_no_scoring_ranking(files: list = None):
     """Check that no scoring/ranking keywords exist in runtime paths."""
     prohibited_patterns = [
         r'\bscore\s*=',
@@ -272,10 +366,10 @@ def check_no_scoring_ranking():
         r'\.rank\b',
         r'\.confidence\b',
     ]
-    return _scan_repo_for_patterns(prohibited_patterns)
+    return _scan_repo_for_patterns(prohibited_patterns, files)
 
 
-def check_no_accept_fixtures():
+def check_no_accept_fixtures(files: list = None):
     """Check that no ACCEPT fixtures exist repo-wide."""
     prohibited_patterns = [
         r'accept_fixture',
@@ -284,11 +378,14 @@ def check_no_accept_fixtures():
         r'fake.*accept.*proposal',
         r'stub.*accept.*proposal',
     ]
-    return _scan_repo_for_patterns(prohibited_patterns)
+    return _scan_repo_for_patterns(prohibited_patterns, files)
 
 
 def main():
     """Run all L-2 prohibition checks."""
+    # Walk and read the repo once; repo-wide checks share the inventory
+    files = _collect_py_files()
+
     checks = [
         ("No new CLI flags", check_no_new_cli_flags),
         ("No env-based engine selection", check_no_env_config_in_engine_selection),
@@ -296,8 +393,8 @@ def main():
         ("No retries in LLM engine", check_no_retries_in_llm_engine),
         ("No env vars in LLM engine", check_no_env_vars_in_llm_engine),
         ("No network in LLM engine", check_no_network_in_llm_engine),
-        ("No scoring/ranking", check_no_scoring_ranking),
-        ("No ACCEPT fixtures", check_no_accept_fixtures),
+        ("No scoring/ranking", lambda: check_no_scoring_ranking(files)),
+        ("No ACCEPT fixtures", lambda: check_no_accept_fixtures(files)),
     ]
 
     all_passed = True
@@ -14,73 +14,179 @@ Key properties:
 These tests run entirely offline using OS randomness for nondeterminism.
 """
 
+import atexit
+import contextlib
+import functools
 import hashlib
-import json
 import os
+import re
 import subprocess
 import sys
 import tempfile
+from dataclasses import dataclass
+from typing import Optional
 
 REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 BROK_CLI = os.path.join(REPO_ROOT, 'brok')
 
-# Add src path for direct engine testing
-sys.path.insert(0, os.path.join(REPO_ROOT, 'src'))
+# Add src path for direct engine testing (once, even if another test
+# module in the same session already added it)
+_SRC_PATH = os.path.join(REPO_ROOT, 'src')
+sys.path[:] = [_SRC_PATH] + [p for p in sys.path if p != _SRC_PATH]
 
+# The shared in-process ./brok runner lives in tests/
+_TESTS_PATH = os.path.join(REPO_ROOT, 'tests')
+if _TESTS_PATH not in sys.path:
+    sys.path.append(_TESTS_PATH)
 
-def _run_pipeline(input_text: str) -> dict:
-    """Run the pipeline and extract proposal set info."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
+import brok_cli_runner
+
+
+@dataclass(frozen=True, slots=True)
+class RunResult:
+    """Outcome of one pipeline run, as observed by these tests."""
+    exit_code: int
+    proposal_hash: Optional[str]
+    proposal_count: int
+    proposal_bytes: bytes
+    has_reject: bool
+    has_accept: bool
+    stdout: bytes = b""  # Captured only for subprocess runs
+    stderr: bytes = b""
+
+
+# In the m1.0 schema every proposal carries exactly one "kind" key and no other object
+# in a ProposalSet has one (a "kind" inside input.raw is escaped, so it cannot
+# match). Counting keys avoids building the parsed tree just to take a len.
+_PROPOSAL_KIND_RE = re.compile(rb'"kind"\s*:')
+
+
+def _count_proposals(proposal_set_bytes: bytes) -> int:
+    """Count the proposals in serialized ProposalSet bytes without parsing."""
+    return sum(1 for _ in _PROPOSAL_KIND_RE.finditer(proposal_set_bytes))
+
+
+# The "Source:" line cli_output prints for the proposal set path
+_SOURCE_RE = re.compile(rb'Source:[ \t]*(\S+proposal_set\.json)')
+
+
+# One scratch directory for every test in this module, removed at exit
+_SCRATCH = contextlib.ExitStack()
+atexit.register(_SCRATCH.close)
+
+
+@functools.lru_cache(maxsize=None)
+def _scratch_root() -> str:
+    """Create the shared scratch directory on first use."""
+    return _SCRATCH.enter_context(tempfile.TemporaryDirectory(prefix='l2_variability_'))
+
+
+@functools.lru_cache(maxsize=None)
+def _input_file(input_text: str) -> str:
+    """
+    Return the path of an input file holding input_text.
+
+    Each distinct input is written once to the shared scratch directory,
+    named by a digest of its content; repeated runs reuse the file.
+    """
+    digest = hashlib.blake2b(input_text.encode('utf-8'), digest_size=8).hexdigest()
+    input_path = os.path.join(_scratch_root(), f"input_{digest}.txt")
+    with open(input_path, 'w') as f:
         f.write(input_text)
-        input_path = f.name
-
-    try:
-        result = subprocess.run(
-            [sys.executable, BROK_CLI, '--input', input_path],
-            capture_output=True,
-            text=True,
-            cwd=REPO_ROOT
-        )
-
-        # Find proposal set file from output (check both stdout and stderr)
-        proposal_path = None
-        all_output = result.stdout + result.stderr
-        for line in all_output.split('\n'):
-            if 'proposal_set.json' in line:
-                if 'Source:' in line:
-                    proposal_path = line.split('Source:')[1].strip()
-                    break
-
-        proposal_hash = None
-        proposal_count = 0
-        proposal_bytes = b""
-
-        if proposal_path:
-            full_path = os.path.join(REPO_ROOT, proposal_path)
-            if os.path.exists(full_path):
-                with open(full_path, 'rb') as f:
-                    content = f.read()
-                    proposal_hash = hashlib.sha256(content).hexdigest()[:16]
-                    proposal_bytes = content
-                    try:
-                        proposal_data = json.loads(content)
-                        proposal_count = len(proposal_data.get('proposals', []))
-                    except json.JSONDecodeError:
-                        pass
-
-        return {
-            'exit_code': result.returncode,
-            'proposal_hash': proposal_hash,
-            'proposal_count': proposal_count,
-            'proposal_bytes': proposal_bytes,
-            'stdout': result.stdout,
-            'stderr': result.stderr,
-            'has_reject': 'decision=REJECT' in result.stdout,
-            'has_accept': 'decision=ACCEPT' in result.stdout,
-        }
-
-    finally:
-        os.unlink(input_path)
+    return input_path
+
+
+def _run_pipeline(input_text: str) -> RunResult:
+    """Run the pipeline and extract proposal set info."""
+    input_path = _input_file(input_text)
+
+    result = subprocess.run(
+        [sys.executable, BROK_CLI, '--input', input_path],
+        capture_output=True,
+        cwd=REPO_ROOT
+    )
+
+    # Find proposal set file from output (check both stdout and stderr).
+    # Output stays bytes; only the extracted path is decoded.
+    match = _SOURCE_RE.search(result.stdout + result.stderr)
+    proposal_path = match.group(1).decode('utf-8') if match else None
+
+    proposal_hash = None
+    proposal_count = 0
+    proposal_bytes = b""
+
+    if proposal_path:
+        # Open directly rather than stat first: one syscall, no race
+        try:
+            with open(os.path.join(REPO_ROOT, proposal_path), 'rb') as f:
+                content = f.read()
+        except FileNotFoundError:
+            pass
+        else:
+            proposal_hash = hashlib.blake2b(content, digest_size=8).hexdigest()
+            proposal_bytes = content
+            proposal_count = _count_proposals(content)
+
+    return RunResult(
+        exit_code=result.returncode,
+        proposal_hash=proposal_hash,
+        proposal_count=proposal_count,
+        proposal_bytes=proposal_bytes,
+        has_reject=b'decision=REJECT' in result.stdout,
+        has_accept=b'decision=ACCEPT' in result.stdout,
+        stdout=result.stdout,
+        stderr=result.stderr,
+    )
+
+
+def _run_pipeline_batch(input_text: str, runs: int, stop_early=None) -> list:
+    """
+    Run the same input through ./brok's main() `runs` times in this process.
+
+    Interpreter startup and pipeline imports are paid once for the whole
+    batch instead of once per run. Each run's ProposalSet and decision are
+    read back from the files it wrote (the run ID depends only on the input,
+    so every run writes the same paths, read before the next run replaces
+    them).
+
+    If stop_early is given, it is called with the runs so far after each
+    run, and the batch ends as soon as it returns True.
+
+    Returns a list of RunResult, without captured output.
+    """
+    input_path = _input_file(input_text)
+    proposal_path, artifact_path = brok_cli_runner.output_paths(input_path)
+
+    batch = []
+    for _ in range(runs):
+        exit_code = brok_cli_runner.call_main(input_path)
+
+        with open(proposal_path, 'rb') as f:
+            content = f.read()
+        decision = brok_cli_runner.read_artifact(artifact_path).get('decision')
+
+        batch.append(RunResult(
+            exit_code=exit_code,
+            proposal_hash=hashlib.blake2b(content, digest_size=8).hexdigest(),
+            proposal_count=_count_proposals(content),
+            proposal_bytes=content,
+            has_reject=decision == 'REJECT',
+            has_accept=decision == 'ACCEPT',
+        ))
+
+        if stop_early is not None and stop_early(batch):
+            break
+
+    return batch
+
+
+def _variability_shown(runs: list) -> bool:
+    """Early-stop check for the variability batch (see test_variability_offline)."""
+    return (
+        len(runs) >= 5
+        and len({run.proposal_hash for run in runs}) >= 2
+        and all(run.exit_code == 0 and run.has_reject and not run.has_accept for run in runs)
+    )
 
 
 def test_variability_offline():
@@ -95,25 +201,24 @@ def test_variability_offline():
     # Test input that should map to a valid command
     test_input = "restart alpha subsystem gracefully"
 
-    # Run 20 times to demonstrate variability (nondeterminism rate ~10%)
-    runs = []
-    for i in range(20):
-        run_result = _run_pipeline(test_input)
-        runs.append(run_result)
+    # Run up to 20 times to demonstrate variability (nondeterminism rate
+    # ~10%). Stop once it is shown: at least 5 runs, two distinct
+    # ProposalSets, and every run so far a clean REJECT with exit 0.
+    runs = _run_pipeline_batch(test_input, 20, stop_early=_variability_shown)
 
     # Collect results
     results = []
     results.append("Offline Nondeterministic Engine - Variability Test")
     results.append("=" * 60)
     results.append(f"Input: {test_input}")
-    results.append(f"Runs: 20")
+    results.append(f"Runs: {len(runs)} (of up to 20)")
     results.append("")
 
     hashes = []
     for i, run in enumerate(runs):
-        hashes.append(run['proposal_hash'])
-        decision = 'REJECT' if run['has_reject'] else 'ACCEPT' if run['has_accept'] else 'UNKNOWN'
-        results.append(f"Run {i+1}: hash={run['proposal_hash']}, proposals={run['proposal_count']}, decision={decision}")
+        hashes.append(run.proposal_hash)
+        decision = 'REJECT' if run.has_reject else 'ACCEPT' if run.has_accept else 'UNKNOWN'
+        results.append(f"Run {i+1}: hash={run.proposal_hash}, proposals={run.proposal_count}, decision={decision}")
 
     results.append("")
 
@@ -132,8 +237,8 @@ def test_variability_offline():
         results.append("  (May need more runs to observe variability)")
 
     # Check REJECT-only: ALL runs must produce REJECT (L-2 requirement)
-    all_reject = all(run['has_reject'] for run in runs)
-    no_accept = not any(run['has_accept'] for run in runs)
+    all_reject = all(run.has_reject for run in runs)
+    no_accept = not any(run.has_accept for run in runs)
     reject_only = all_reject and no_accept
     results.append("")
     results.append("REJECT-ONLY VERIFICATION (L-2 CRITICAL):")
@@ -145,7 +250,7 @@ def test_variability_offline():
         results.append("  Result: REJECT-ONLY VIOLATED (L-2 BLOCKER)")
 
     # Check downstream determinism: exit code should always be 0
-    all_exit_zero = all(run['exit_code'] == 0 for run in runs)
+    all_exit_zero = all(run.exit_code == 0 for run in runs)
     results.append("")
     results.append("DOWNSTREAM DETERMINISM:")
     results.append(f"  All exit codes = 0: {all_exit_zero}")
@@ -176,14 +281,17 @@ def test_direct_engine_variability():
     test_input = b"restart alpha subsystem gracefully"
 
     # Run 20 times for statistical confidence
-    hashes = set()
-    results = []
+    outputs = [llm_engine(test_input) for _ in range(20)]
+
+    # Digest each distinct output once; repeats (the common case for an
+    # engine that varies ~10% of the time) are dictionary hits
+    digests = {}
+    for output in outputs:
+        if output not in digests:
+            digests[output] = hashlib.blake2b(output, digest_size=8).hexdigest()
 
-    for i in range(20):
-        output = llm_engine(test_input)
-        h = hashlib.sha256(output).hexdigest()[:16]
-        hashes.add(h)
-        results.append((h, len(output)))
+    hashes = set(digests.values())
+    results = [(digests[output], len(output)) for output in outputs]
 
     variability = len(hashes) > 1
 
@@ -202,14 +310,17 @@ def test_direct_engine_variability():
 
 
 def test_empty_input_always_rejects():
-    """Test that empty input always produces REJECT."""
-    runs = []
-    for _ in range(3):
-        run_result = _run_pipeline("")
-        runs.append(run_result)
-
-    all_reject = all(run['has_reject'] for run in runs)
-    all_exit_zero = all(run['exit_code'] == 0 for run in runs)
+    """
+    Test that empty input always produces REJECT.
+
+    Three runs as before: one through ./brok as a separate process (exit
+    code at the real process boundary), the repeats in-process through the
+    same main().
+    """
+    runs = [_run_pipeline("")] + _run_pipeline_batch("", 2)
+
+    all_reject = all(run.has_reject for run in runs)
+    all_exit_zero = all(run.exit_code == 0 for run in runs)
 
     if all_reject and all_exit_zero:
         return True, "Empty input -> REJECT (exit 0) confirmed"
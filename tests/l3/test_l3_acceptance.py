@@ -29,19 +29,31 @@ Test categories:
 5. Determinism
 """
 
+import difflib
+import functools
 import json
 import os
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
-REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-BROK_CLI = os.path.join(REPO_ROOT, 'brok')
-DEMO_INPUT = os.path.join(REPO_ROOT, 'inputs', 'l3_accept_demo.txt')
+REPO_ROOT = Path(__file__).resolve().parents[2]
+BROK_CLI = REPO_ROOT / 'brok'
+DEMO_INPUT = REPO_ROOT / 'inputs' / 'l3_accept_demo.txt'
 
-# Add paths for direct module access
-sys.path.insert(0, os.path.join(REPO_ROOT, 'artifact', 'src'))
-sys.path.insert(0, os.path.join(REPO_ROOT, 'proposal', 'src'))
+# Add paths for direct module access. They go first, in this order, and
+# any copies already added by other test modules in the same session are
+# dropped so sys.path does not grow with every file collected.
+_SOURCE_PATHS = [
+    str(REPO_ROOT / 'proposal' / 'src'),
+    str(REPO_ROOT / 'artifact' / 'src'),
+    str(REPO_ROOT / 'tests'),
+]
+sys.path[:] = _SOURCE_PATHS + [p for p in sys.path if p not in _SOURCE_PATHS]
+
+from brok_cli_runner import run_cli
 
 
 # =============================================================================
@@ -56,16 +68,28 @@ L3_ENVELOPE = {
 }
 
 
-def _make_proposal_set(proposals, input_raw="status of alpha subsystem\n"):
-    """Create a ProposalSet dict."""
-    return {
-        "schema_version": "m1.0",
-        "input": {"raw": input_raw},
-        "proposals": proposals
-    }
+# ProposalSet fields shared by every test; only "proposals" varies
+_PROPOSAL_SET_TEMPLATE = {
+    "schema_version": "m1.0",
+    "input": {"raw": "status of alpha subsystem\n"},
+    "proposals": []
+}
 
 
-def _run_artifact_builder(proposal_set):
+def _make_proposal_set(proposals, input_raw=None):
+    """
+    Create a ProposalSet dict.
+
+    A shallow copy of the template: nested values are shared between
+    ProposalSets, which is safe because the builder never mutates its input.
+    """
+    proposal_set = dict(_PROPOSAL_SET_TEMPLATE, proposals=proposals)
+    if input_raw is not None:
+        proposal_set["input"] = {"raw": input_raw}
+    return proposal_set
+
+
+def _build_artifact(proposal_set):
     """
     Run the artifact builder directly with a ProposalSet.
     This tests the AUTHORITATIVE L-3 envelope gate.
@@ -79,15 +103,31 @@ def _run_artifact_builder(proposal_set):
     )
 
 
-def _run_cli(input_path):
-    """Run the CLI and return result."""
-    result = subprocess.run(
-        [sys.executable, BROK_CLI, '--input', input_path],
-        capture_output=True,
-        text=True,
-        cwd=REPO_ROOT
+@functools.lru_cache(maxsize=64)
+def _build_artifact_cached(proposal_set_json):
+    """Build once per distinct ProposalSet (keyed by its canonical JSON)."""
+    return _build_artifact(json.loads(proposal_set_json))
+
+
+def _run_artifact_builder(proposal_set):
+    """
+    Run the artifact builder with a ProposalSet, reusing the artifact when
+    an identical ProposalSet has already been built (the builder is pure).
+
+    The determinism tests call _build_artifact() instead, so every one of
+    their repeated builds really runs.
+    """
+    return _build_artifact_cached(
+        json.dumps(proposal_set, sort_keys=True, separators=(',', ':'))
     )
-    return result
+
+
+def _describe(artifact):
+    """Summarize an artifact the way the CLI's final result line does."""
+    reason_code = artifact.get("reject_payload", {}).get("reason_code")
+    if reason_code:
+        return f"decision={artifact.get('decision')} reason_code={reason_code}"
+    return f"decision={artifact.get('decision')}"
 
 
 # =============================================================================
@@ -114,143 +154,75 @@ def test_exact_envelope_accepts():
 
 
 # =============================================================================
-# Test Category 2: Schema-Valid Alternatives REJECT (Brittle Envelope Proof)
+# Test Categories 2 and 3: Schema-Valid Alternatives and Extra Slots REJECT
 # =============================================================================
-def test_status_query_beta_rejects():
-    """
-    AUTHORITATIVE TEST: STATUS_QUERY on beta is schema-valid but MUST REJECT.
-    This proves the envelope is brittle, not "any valid proposal."
-    """
-    proposal = {
-        "kind": "ROUTE_CANDIDATE",
-        "payload": {
-            "intent": "STATUS_QUERY",
-            "slots": {"target": "beta"}
-        }
-    }
-    proposal_set = _make_proposal_set([proposal])
-    artifact = _run_artifact_builder(proposal_set)
-
-    decision = artifact.get("decision")
-    if decision != "REJECT":
-        return False, f"Expected REJECT for STATUS_QUERY beta, got {decision}"
-
-    notes = artifact.get("reject_payload", {}).get("notes", [])
-    if "L3_ENVELOPE_MISMATCH" not in notes:
-        return False, f"Expected L3_ENVELOPE_MISMATCH note, got {notes}"
-
-    return True, "STATUS_QUERY target=beta → REJECT (L3_ENVELOPE_MISMATCH)"
-
-
-def test_status_query_gamma_rejects():
-    """
-    AUTHORITATIVE TEST: STATUS_QUERY on gamma is schema-valid but MUST REJECT.
-    """
-    proposal = {
+def _route_candidate(intent, slots):
+    """Create a schema-valid ROUTE_CANDIDATE proposal."""
+    return {
         "kind": "ROUTE_CANDIDATE",
         "payload": {
-            "intent": "STATUS_QUERY",
-            "slots": {"target": "gamma"}
+            "intent": intent,
+            "slots": slots
         }
     }
-    proposal_set = _make_proposal_set([proposal])
-    artifact = _run_artifact_builder(proposal_set)
 
-    decision = artifact.get("decision")
-    if decision != "REJECT":
-        return False, f"Expected REJECT for STATUS_QUERY gamma, got {decision}"
 
-    return True, "STATUS_QUERY target=gamma → REJECT (L3_ENVELOPE_MISMATCH)"
+# Each proposal is schema-valid but differs from L3_ENVELOPE, so each MUST
+# REJECT with the L3_ENVELOPE_MISMATCH note. This proves the envelope is
+# brittle, not "any valid proposal": slots must be {"target": "alpha"} exactly.
+REJECT_CASES = [
+    ("STATUS_QUERY beta → REJECT",
+     _route_candidate("STATUS_QUERY", {"target": "beta"})),
+    ("STATUS_QUERY gamma → REJECT",
+     _route_candidate("STATUS_QUERY", {"target": "gamma"})),
+    ("STOP_SUBSYSTEM alpha → REJECT",
+     _route_candidate("STOP_SUBSYSTEM", {"target": "alpha"})),
+    ("RESTART_SUBSYSTEM alpha → REJECT",
+     _route_candidate("RESTART_SUBSYSTEM", {"target": "alpha"})),
+    ("RESTART_SUBSYSTEM beta graceful → REJECT",
+     _route_candidate("RESTART_SUBSYSTEM", {"target": "beta", "mode": "graceful"})),
+    ("Extra mode slot → REJECT",
+     _route_candidate("STATUS_QUERY", {"target": "alpha", "mode": "graceful"})),
+]
 
 
-def test_stop_subsystem_alpha_rejects():
+def _check_envelope_mismatch_rejects(name, proposal):
     """
-    AUTHORITATIVE TEST: STOP_SUBSYSTEM on alpha is schema-valid but MUST REJECT.
+    AUTHORITATIVE CHECK: one REJECT_CASES entry produces REJECT with the
+    L3_ENVELOPE_MISMATCH note.
     """
-    proposal = {
-        "kind": "ROUTE_CANDIDATE",
-        "payload": {
-            "intent": "STOP_SUBSYSTEM",
-            "slots": {"target": "alpha"}
-        }
-    }
-    proposal_set = _make_proposal_set([proposal])
-    artifact = _run_artifact_builder(proposal_set)
+    artifact = _run_artifact_builder(_make_proposal_set([proposal]))
 
     decision = artifact.get("decision")
     if decision != "REJECT":
-        return False, f"Expected REJECT for STOP_SUBSYSTEM alpha, got {decision}"
-
-    return True, "STOP_SUBSYSTEM target=alpha → REJECT (L3_ENVELOPE_MISMATCH)"
-
-
-def test_restart_subsystem_alpha_rejects():
-    """
-    AUTHORITATIVE TEST: RESTART_SUBSYSTEM on alpha is schema-valid but MUST REJECT.
-    """
-    proposal = {
-        "kind": "ROUTE_CANDIDATE",
-        "payload": {
-            "intent": "RESTART_SUBSYSTEM",
-            "slots": {"target": "alpha"}
-        }
-    }
-    proposal_set = _make_proposal_set([proposal])
-    artifact = _run_artifact_builder(proposal_set)
+        return False, f"Expected REJECT, got {decision}"
 
-    decision = artifact.get("decision")
-    if decision != "REJECT":
-        return False, f"Expected REJECT for RESTART_SUBSYSTEM alpha, got {decision}"
+    notes = artifact.get("reject_payload", {}).get("notes", [])
+    if "L3_ENVELOPE_MISMATCH" not in notes:
+        return False, f"Expected L3_ENVELOPE_MISMATCH note, got {notes}"
 
-    return True, "RESTART_SUBSYSTEM target=alpha → REJECT (L3_ENVELOPE_MISMATCH)"
+    return True, f"{name} (L3_ENVELOPE_MISMATCH)"
 
 
-def test_restart_subsystem_beta_graceful_rejects():
+def test_envelope_mismatch_rejects():
     """
-    AUTHORITATIVE TEST: RESTART_SUBSYSTEM on beta with mode is schema-valid but MUST REJECT.
+    AUTHORITATIVE TEST: Every REJECT_CASES proposal MUST REJECT.
     """
-    proposal = {
-        "kind": "ROUTE_CANDIDATE",
-        "payload": {
-            "intent": "RESTART_SUBSYSTEM",
-            "slots": {"target": "beta", "mode": "graceful"}
-        }
-    }
-    proposal_set = _make_proposal_set([proposal])
-    artifact = _run_artifact_builder(proposal_set)
+    failures = []
+    for name, proposal in REJECT_CASES:
+        passed, message = _check_envelope_mismatch_rejects(name, proposal)
+        if not passed:
+            failures.append(f"{name}: {message}")
 
-    decision = artifact.get("decision")
-    if decision != "REJECT":
-        return False, f"Expected REJECT for RESTART_SUBSYSTEM beta graceful, got {decision}"
+    if failures:
+        return False, "; ".join(failures)
 
-    return True, "RESTART_SUBSYSTEM target=beta mode=graceful → REJECT"
+    return True, f"{len(REJECT_CASES)} schema-valid alternatives → REJECT"
 
 
 # =============================================================================
 # Test Category 3: Structural REJECT Cases
 # =============================================================================
-def test_extra_mode_slot_rejects():
-    """
-    AUTHORITATIVE TEST: Adding mode slot to STATUS_QUERY alpha MUST REJECT.
-    The envelope requires slots == {"target": "alpha"} exactly.
-    """
-    proposal = {
-        "kind": "ROUTE_CANDIDATE",
-        "payload": {
-            "intent": "STATUS_QUERY",
-            "slots": {"target": "alpha", "mode": "graceful"}
-        }
-    }
-    proposal_set = _make_proposal_set([proposal])
-    artifact = _run_artifact_builder(proposal_set)
-
-    decision = artifact.get("decision")
-    if decision != "REJECT":
-        return False, f"Expected REJECT for extra mode slot, got {decision}"
-
-    return True, "STATUS_QUERY alpha + mode slot → REJECT (L3_ENVELOPE_MISMATCH)"
-
-
 def test_zero_proposals_rejects():
     """
     AUTHORITATIVE TEST: Zero proposals produces REJECT.
@@ -333,9 +305,9 @@ def test_extra_field_in_proposal_rejects():
 # =============================================================================
 # Test Category 4: CLI Integration
 # =============================================================================
-EXAMPLES_DIR = os.path.join(REPO_ROOT, 'examples', 'inputs')
-ACCEPT_STATUS_ALPHA = os.path.join(EXAMPLES_DIR, 'accept_status_alpha.txt')
-ACCEPT_STATUS_BETA = os.path.join(EXAMPLES_DIR, 'accept_status_beta.txt')
+EXAMPLES_DIR = REPO_ROOT / 'examples' / 'inputs'
+ACCEPT_STATUS_ALPHA = EXAMPLES_DIR / 'accept_status_alpha.txt'
+ACCEPT_STATUS_BETA = EXAMPLES_DIR / 'accept_status_beta.txt'
 
 
 def test_demo_input_via_cli_accepts():
@@ -344,19 +316,16 @@ def test_demo_input_via_cli_accepts():
     The engine emits the L-3 envelope for this input, and the authoritative
     gate accepts it.
     """
-    if not os.path.exists(DEMO_INPUT):
+    if not DEMO_INPUT.exists():
         return False, f"Demo input file not found: {DEMO_INPUT}"
 
-    result = _run_cli(DEMO_INPUT)
-
-    if result.returncode != 0:
-        return False, f"Expected exit code 0, got {result.returncode}"
+    returncode, artifact = run_cli(DEMO_INPUT)
 
-    if 'decision=ACCEPT' not in result.stdout:
-        return False, f"Expected ACCEPT, got: {result.stdout[-200:]}"
+    if artifact.get("decision") != "ACCEPT":
+        return False, f"Expected ACCEPT, got: {_describe(artifact)}"
 
-    if 'executed=true' not in result.stdout:
-        return False, f"Expected executed=true in output"
+    if returncode != 0:
+        return False, f"Expected exit code 0 (executed), got {returncode}"
 
     return True, "Demo input via CLI → ACCEPT"
 
@@ -366,19 +335,16 @@ def test_example_accept_status_alpha_accepts():
     CLI TEST: The examples/inputs/accept_status_alpha.txt produces ACCEPT.
     This is the canonical demo trigger file for users.
     """
-    if not os.path.exists(ACCEPT_STATUS_ALPHA):
+    if not ACCEPT_STATUS_ALPHA.exists():
         return False, f"Example file not found: {ACCEPT_STATUS_ALPHA}"
 
-    result = _run_cli(ACCEPT_STATUS_ALPHA)
+    returncode, artifact = run_cli(ACCEPT_STATUS_ALPHA)
 
-    if result.returncode != 0:
-        return False, f"Expected exit code 0, got {result.returncode}"
+    if artifact.get("decision") != "ACCEPT":
+        return False, f"Expected ACCEPT, got: {_describe(artifact)}"
 
-    if 'decision=ACCEPT' not in result.stdout:
-        return False, f"Expected ACCEPT, got: {result.stdout[-200:]}"
-
-    if 'executed=true' not in result.stdout:
-        return False, f"Expected executed=true in output"
+    if returncode != 0:
+        return False, f"Expected exit code 0 (executed), got {returncode}"
 
     return True, "examples/inputs/accept_status_alpha.txt → ACCEPT"
 
@@ -388,13 +354,16 @@ def test_example_accept_status_beta_rejects():
     CLI TEST: The examples/inputs/accept_status_beta.txt produces REJECT under L-3.
     This file contains "status of beta" which is NOT the demo trigger.
     """
-    if not os.path.exists(ACCEPT_STATUS_BETA):
+    if not ACCEPT_STATUS_BETA.exists():
         return False, f"Example file not found: {ACCEPT_STATUS_BETA}"
 
-    result = _run_cli(ACCEPT_STATUS_BETA)
+    returncode, artifact = run_cli(ACCEPT_STATUS_BETA)
+
+    if returncode != 0:
+        return False, f"Expected exit code 0, got {returncode}"
 
-    if 'decision=REJECT' not in result.stdout:
-        return False, f"Expected REJECT for status beta, got: {result.stdout[-200:]}"
+    if artifact.get("decision") != "REJECT":
+        return False, f"Expected REJECT for status beta, got: {_describe(artifact)}"
 
     return True, "examples/inputs/accept_status_beta.txt → REJECT"
 
@@ -409,10 +378,13 @@ def test_non_demo_input_via_cli_rejects():
         input_path = f.name
 
     try:
-        result = _run_cli(input_path)
+        returncode, artifact = run_cli(input_path)
 
-        if 'decision=REJECT' not in result.stdout:
-            return False, f"Expected REJECT for non-demo input, got: {result.stdout[-200:]}"
+        if returncode != 0:
+            return False, f"Expected exit code 0, got {returncode}"
+
+        if artifact.get("decision") != "REJECT":
+            return False, f"Expected REJECT for non-demo input, got: {_describe(artifact)}"
 
         return True, "Non-demo input via CLI → REJECT"
     finally:
@@ -428,13 +400,21 @@ def test_determinism_of_envelope_gate():
     """
     proposal_set = _make_proposal_set([L3_ENVELOPE])
 
-    results = []
-    for _ in range(5):
-        artifact = _run_artifact_builder(proposal_set)
-        results.append(json.dumps(artifact, sort_keys=True))
+    # Compare the repeat builds to the first with dict equality (deep and
+    # key-order independent); serialize only to explain a mismatch.
+    first = _build_artifact(proposal_set)
+    mismatches = [
+        artifact for artifact in (_build_artifact(proposal_set) for _ in range(4))
+        if artifact != first
+    ]
 
-    if len(set(results)) != 1:
-        return False, f"Non-deterministic: {len(set(results))} unique results"
+    if mismatches:
+        diff = '\n'.join(difflib.unified_diff(
+            json.dumps(first, indent=2, sort_keys=True).splitlines(),
+            json.dumps(mismatches[0], indent=2, sort_keys=True).splitlines(),
+            'run 1', 'first mismatch', lineterm=''
+        ))
+        return False, f"Non-deterministic: {len(mismatches)} of 4 repeat runs differ\n{diff}"
 
     return True, "Authoritative gate deterministic (5 runs)"
 
@@ -443,18 +423,11 @@ def test_determinism_of_reject_gate():
     """
     Repeated calls with schema-valid alternative yield identical REJECT.
     """
-    proposal = {
-        "kind": "ROUTE_CANDIDATE",
-        "payload": {
-            "intent": "STATUS_QUERY",
-            "slots": {"target": "beta"}
-        }
-    }
-    proposal_set = _make_proposal_set([proposal])
+    proposal_set = _make_proposal_set([REJECT_CASES[0][1]])
 
     results = []
     for _ in range(5):
-        artifact = _run_artifact_builder(proposal_set)
+        artifact = _build_artifact(proposal_set)
         results.append(artifact.get("decision"))
 
     if not all(d == "REJECT" for d in results):
@@ -473,14 +446,13 @@ def test_cli_rejects_unknown_flags():
     result = subprocess.run(
         [sys.executable, BROK_CLI, '--unknown-flag', '--input', DEMO_INPUT],
         capture_output=True,
-        text=True,
         cwd=REPO_ROOT
     )
 
     if result.returncode == 0:
         return False, "CLI should reject unknown flags"
 
-    if 'unrecognized arguments' not in result.stderr:
+    if b'unrecognized arguments' not in result.stderr:
         return False, f"Expected 'unrecognized arguments' error"
 
     return True, "CLI rejects unknown flags"
@@ -493,7 +465,6 @@ def test_cli_requires_input_flag():
     result = subprocess.run(
         [sys.executable, BROK_CLI],
         capture_output=True,
-        text=True,
         cwd=REPO_ROOT
     )
 
@@ -506,21 +477,31 @@ def test_cli_requires_input_flag():
 # =============================================================================
 # Main
 # =============================================================================
+def _run_test(test_fn) -> tuple:
+    """Run one test function; an unexpected exception counts as a failure."""
+    try:
+        return test_fn()
+    except Exception as e:
+        return False, f"Exception: {type(e).__name__}: {e}"
+
+
+def _run_lane(lane) -> dict:
+    """Run a sequence of test functions in order; map each to its outcome."""
+    return {test_fn: _run_test(test_fn) for test_fn in lane}
+
+
 def main():
     """Run all L-3 single-envelope acceptance tests."""
     tests = [
         # Exact envelope ACCEPT
         ("Exact L-3 envelope → ACCEPT", test_exact_envelope_accepts),
 
-        # Schema-valid alternatives REJECT (brittle proof)
-        ("STATUS_QUERY beta → REJECT", test_status_query_beta_rejects),
-        ("STATUS_QUERY gamma → REJECT", test_status_query_gamma_rejects),
-        ("STOP_SUBSYSTEM alpha → REJECT", test_stop_subsystem_alpha_rejects),
-        ("RESTART_SUBSYSTEM alpha → REJECT", test_restart_subsystem_alpha_rejects),
-        ("RESTART_SUBSYSTEM beta graceful → REJECT", test_restart_subsystem_beta_graceful_rejects),
+        # Schema-valid alternatives and extra slots REJECT (brittle proof),
+        # reported one line per case
+        *((name, functools.partial(_check_envelope_mismatch_rejects, name, proposal))
+          for name, proposal in REJECT_CASES),
 
         # Structural REJECT cases
-        ("Extra mode slot → REJECT", test_extra_mode_slot_rejects),
         ("Zero proposals → REJECT", test_zero_proposals_rejects),
         ("Two proposals → REJECT", test_two_proposals_rejects),
         ("Invalid intent → REJECT", test_invalid_intent_rejects),
@@ -541,16 +522,30 @@ def main():
         ("CLI requires --input", test_cli_requires_input_flag),
     ]
 
+    # The argparse tests spend their time waiting on ./brok subprocesses,
+    # so they run on worker threads while everything else runs here. The
+    # in-process CLI tests swap sys.argv and file descriptors 1 and 2, so
+    # they stay on this thread.
+    cli_lanes = [
+        (test_cli_rejects_unknown_flags,),
+        (test_cli_requires_input_flag,),
+    ]
+    cli_tests = {test_fn for lane in cli_lanes for test_fn in lane}
+
+    with ThreadPoolExecutor(max_workers=len(cli_lanes)) as executor:
+        lane_futures = [executor.submit(_run_lane, lane) for lane in cli_lanes]
+        outcomes = {
+            test_fn: _run_test(test_fn)
+            for _, test_fn in tests if test_fn not in cli_tests
+        }
+        for future in lane_futures:
+            outcomes.update(future.result())
+
     all_passed = True
     results = []
 
     for name, test_fn in tests:
-        try:
-            passed, message = test_fn()
-        except Exception as e:
-            passed = False
-            message = f"Exception: {type(e).__name__}: {e}"
-
+        passed, message = outcomes[test_fn]
         status = "PASS" if passed else "FAIL"
         results.append((name, status, message))
         if not passed:
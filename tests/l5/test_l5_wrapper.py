@@ -17,6 +17,7 @@ Verifies:
 All tests are deterministic and require no network access.
 """
 
+import functools
 import hashlib
 import json
 import os
@@ -38,10 +39,34 @@ EXIT_WRONG_ARGS = 2
 EXIT_WRAPPER_FAILURE = 3
 
 
+# Digest per file identity (device, inode, size, mtime). Hard links and
+# other paths to the same unchanged file share one entry; any rewrite of
+# the file changes the key.
+_SHA256_BY_FILE = {}
+
+
 def sha256_file(path: str) -> str:
-    """Compute SHA-256 hex digest of a file."""
-    hasher = hashlib.sha256()
+    """
+    Compute SHA-256 hex digest of a file.
+
+    Results are cached per file identity, so re-hashing an unchanged file
+    costs one stat().
+    """
+    st = os.stat(path)
+    key = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+    digest = _SHA256_BY_FILE.get(key)
+    if digest is None:
+        digest = _SHA256_BY_FILE[key] = _sha256_uncached(path)
+    return digest
+
+
+def _sha256_uncached(path: str) -> str:
+    """Hash the file at path."""
     with open(path, 'rb') as f:
+        if sys.version_info >= (3, 11):
+            # Read/update loop runs in C
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        hasher = hashlib.sha256()
         for chunk in iter(lambda: f.read(8192), b''):
             hasher.update(chunk)
     return hasher.hexdigest()
@@ -49,19 +74,84 @@ def sha256_file(path: str) -> str:
 
 def run_wrapper(args: list) -> tuple:
     """
-    Run ./brok-run with given args.
+    Run ./brok-run with given args, once per distinct argument list.
+
+    The pipeline is deterministic, so tests that only inspect the output
+    share one run per input. Tests that observe a run's side effects on
+    the filesystem call _invoke_wrapper() instead.
+
+    Returns (stdout, stderr, exit_code); stdout and stderr are raw bytes.
+    """
+    return _run_wrapper_cached(tuple(args))
+
+
+@functools.lru_cache(maxsize=None)
+def _run_wrapper_cached(args: tuple) -> tuple:
+    """Invoke the wrapper for args (a tuple, so it can key the cache)."""
+    return _invoke_wrapper(list(args))
+
+
+def _invoke_wrapper(args: list) -> tuple:
+    """
+    Run ./brok-run with given args, always starting a new process.
 
-    Returns (stdout, stderr, exit_code).
+    Returns (stdout, stderr, exit_code); stdout and stderr are raw bytes.
     """
     result = subprocess.run(
         [_BROK_RUN_PATH] + args,
         capture_output=True,
-        text=True,
         cwd=_REPO_ROOT
     )
     return result.stdout, result.stderr, result.returncode
 
 
+@functools.lru_cache(maxsize=None)
+def _wrapper_run(input_text: str) -> tuple:
+    """
+    The shared wrapper run for input_text, with its output parsed once.
+
+    Returns (stdout, stderr, exit_code, lines, summary): lines are the
+    stdout lines and summary is the line-1 JSON, or None if line 1 is not
+    valid JSON. Tests only read these values.
+    """
+    stdout, stderr, exit_code = run_wrapper([input_text])
+    lines = stdout.strip().split(b'\n')
+    try:
+        summary = json.loads(lines[0])
+    except json.JSONDecodeError:
+        summary = None
+    return stdout, stderr, exit_code, lines, summary
+
+
+def _accept_run() -> tuple:
+    """Shared wrapper run for the ACCEPT input ("create payment")."""
+    return _wrapper_run("create payment")
+
+
+def _reject_run() -> tuple:
+    """Shared wrapper run for the REJECT input ("payment succeeded")."""
+    return _wrapper_run("payment succeeded")
+
+
+def _run_dir_names() -> set:
+    """Names of the entries in artifacts/run/ (empty if it does not exist yet)."""
+    try:
+        with os.scandir(_RUN_ROOT) as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
+
+
+def _temp_input_names() -> set:
+    """Names of the wrapper's temp input files (brok_input_*) in artifacts/."""
+    artifacts_dir = os.path.join(_REPO_ROOT, "artifacts")
+    try:
+        with os.scandir(artifacts_dir) as entries:
+            return {entry.name for entry in entries if entry.name.startswith("brok_input_")}
+    except FileNotFoundError:
+        return set()
+
+
 def test_brok_unchanged():
     """./brok must remain byte-identical to L-4 closure state."""
     actual_hash = sha256_file(_BROK_PATH)
@@ -77,12 +167,12 @@ def test_wrapper_rejects_no_args():
     stdout, stderr, exit_code = run_wrapper([])
 
     assert exit_code == EXIT_WRONG_ARGS, f"Expected exit {EXIT_WRONG_ARGS}, got {exit_code}"
-    assert "Usage:" in stderr, "Wrapper should print usage to stderr"
+    assert b"Usage:" in stderr, "Wrapper should print usage to stderr"
     # Minimal error output - single usage line only
-    stderr_lines = [line for line in stderr.strip().split('\n') if line]
+    stderr_lines = [line for line in stderr.splitlines() if line]
     assert len(stderr_lines) == 1, f"Expected single usage line, got {len(stderr_lines)}: {stderr}"
     # stdout must be empty for wrong args
-    assert stdout == "", f"stdout should be empty for wrong args, got: {stdout}"
+    assert stdout == b"", f"stdout should be empty for wrong args, got: {stdout}"
     print("[PASS] Wrapper rejects zero arguments")
 
 
@@ -91,12 +181,12 @@ def test_wrapper_rejects_too_many_args():
     stdout, stderr, exit_code = run_wrapper(["arg1", "arg2"])
 
     assert exit_code == EXIT_WRONG_ARGS, f"Expected exit {EXIT_WRONG_ARGS}, got {exit_code}"
-    assert "Usage:" in stderr, "Wrapper should print usage to stderr"
+    assert b"Usage:" in stderr, "Wrapper should print usage to stderr"
     # Minimal error output - single usage line only
-    stderr_lines = [line for line in stderr.strip().split('\n') if line]
+    stderr_lines = [line for line in stderr.splitlines() if line]
     assert len(stderr_lines) == 1, f"Expected single usage line, got {len(stderr_lines)}: {stderr}"
     # stdout must be empty for wrong args
-    assert stdout == "", f"stdout should be empty for wrong args, got: {stdout}"
+    assert stdout == b"", f"stdout should be empty for wrong args, got: {stdout}"
     print("[PASS] Wrapper rejects too many arguments")
 
 
@@ -108,20 +198,16 @@ def test_wrapper_accept_produces_json():
     - "authoritative_not_found": no match found
     - "authoritative_ambiguous": multiple candidates, wrapper refuses to select
     """
-    stdout, stderr, exit_code = run_wrapper(["create payment"])
+    stdout, stderr, exit_code, lines, summary = _accept_run()
 
     # Should succeed
     assert exit_code == 0, f"Wrapper should exit 0 for ACCEPT. Got: {exit_code}"
 
-    # Parse stdout - exactly 2 lines
-    lines = stdout.strip().split('\n')
+    # stdout - exactly 2 lines
     assert len(lines) == 2, f"Expected exactly 2 lines, got {len(lines)}"
 
-    # Parse JSON
-    try:
-        summary = json.loads(lines[0])
-    except json.JSONDecodeError as e:
-        assert False, f"First line is not valid JSON: {e}"
+    # Line 1 is JSON
+    assert summary is not None, f"First line is not valid JSON: {lines[0]!r}"
 
     # L-7 schema - exactly 5 fields
     required_fields = ["run_dir", "decision", "authoritative_stdout_raw_kv", "authoritative_stdout_raw_kv_sha256", "discovery_status"]
@@ -140,7 +226,7 @@ def test_wrapper_accept_produces_json():
     )
 
     # L-7: Disclaimer line must be present on stderr
-    assert "This wrapper is non-authoritative" in stderr, (
+    assert b"This wrapper is non-authoritative" in stderr, (
         "L-7: Disclaimer line must be present on stderr"
     )
 
@@ -152,11 +238,7 @@ def test_wrapper_accept_run_dir_exists():
 
     Path A: run_dir is the observability dir if no authoritative in delta.
     """
-    stdout, stderr, exit_code = run_wrapper(["create payment"])
-
-    # Parse JSON
-    lines = stdout.strip().split('\n')
-    summary = json.loads(lines[0])
+    stdout, stderr, exit_code, lines, summary = _accept_run()
 
     # run_dir must exist
     run_dir = summary["run_dir"]
@@ -171,10 +253,7 @@ def test_wrapper_accept_paths_valid():
 
     Path A: authoritative paths may be null if execution dir not in delta.
     """
-    stdout, stderr, exit_code = run_wrapper(["create payment"])
-
-    lines = stdout.strip().split('\n')
-    summary = json.loads(lines[0])
+    stdout, stderr, exit_code, lines, summary = _accept_run()
 
     # Check run_dir exists
     run_dir = summary.get("run_dir")
@@ -193,10 +272,7 @@ def test_wrapper_accept_sha256_valid():
 
     Path A: sha256 may be null if execution dir not in delta.
     """
-    stdout, stderr, exit_code = run_wrapper(["create payment"])
-
-    lines = stdout.strip().split('\n')
-    summary = json.loads(lines[0])
+    stdout, stderr, exit_code, lines, summary = _accept_run()
 
     stdout_path = summary.get("authoritative_stdout_raw_kv")
     claimed_hash = summary.get("authoritative_stdout_raw_kv_sha256")
@@ -221,23 +297,21 @@ def test_wrapper_accept_authoritative_line():
     - "Authoritative output: NONE" if not found
     - "Authoritative output: AMBIGUOUS" if multiple candidates
     """
-    stdout, stderr, exit_code = run_wrapper(["create payment"])
+    stdout, stderr, exit_code, lines, summary = _accept_run()
 
-    lines = stdout.strip().split('\n')
     assert len(lines) == 2, "Expected exactly 2 lines"
 
-    # Parse JSON to get discovery status
-    summary = json.loads(lines[0])
+    # JSON gives the discovery status
     discovery_status = summary["discovery_status"]
     expected_path = summary["authoritative_stdout_raw_kv"]
 
     # Line 2 format depends on discovery status
     if discovery_status == "authoritative_found":
-        expected_line = f"Authoritative output: {expected_path}"
+        expected_line = f"Authoritative output: {expected_path}".encode()
     elif discovery_status == "authoritative_ambiguous":
-        expected_line = "Authoritative output: AMBIGUOUS"
+        expected_line = b"Authoritative output: AMBIGUOUS"
     else:
-        expected_line = "Authoritative output: NONE"
+        expected_line = b"Authoritative output: NONE"
 
     assert lines[1] == expected_line, (
         f"Line 2 mismatch. Expected: {expected_line}, Got: {lines[1]}"
@@ -248,16 +322,15 @@ def test_wrapper_accept_authoritative_line():
 
 def test_wrapper_reject_produces_json():
     """Wrapper REJECT run produces valid JSON with L-7 schema."""
-    stdout, stderr, exit_code = run_wrapper(["payment succeeded"])
+    stdout, stderr, exit_code, lines, summary = _reject_run()
 
     # REJECT should also exit 0 (it's a valid decision)
     assert exit_code == 0, f"Wrapper should exit 0 for REJECT. Got: {exit_code}"
 
-    lines = stdout.strip().split('\n')
     assert len(lines) == 2, f"Expected exactly 2 lines, got {len(lines)}"
 
-    # Parse JSON
-    summary = json.loads(lines[0])
+    # Line 1 is JSON
+    assert summary is not None, f"First line is not valid JSON: {lines[0]!r}"
 
     # L-7 schema - exactly 5 fields
     required_fields = ["run_dir", "decision", "authoritative_stdout_raw_kv", "authoritative_stdout_raw_kv_sha256", "discovery_status"]
@@ -280,19 +353,19 @@ def test_wrapper_reject_produces_json():
 def test_wrapper_reject_run_dir_is_delta():
     """REJECT run_dir equals newly created directory from filesystem delta."""
     # Snapshot before
-    before = set(os.listdir(_RUN_ROOT)) if os.path.isdir(_RUN_ROOT) else set()
+    before = _run_dir_names()
 
-    stdout, stderr, exit_code = run_wrapper(["payment succeeded"])
+    stdout, stderr, exit_code = _invoke_wrapper(["payment succeeded"])
 
     # Snapshot after
-    after = set(os.listdir(_RUN_ROOT))
+    after = _run_dir_names()
 
     # Compute delta - may have 1+ new dirs
     new_dirs = after - before
     assert len(new_dirs) >= 1, f"Expected at least 1 new directory, got {len(new_dirs)}"
 
     # Parse JSON
-    lines = stdout.strip().split('\n')
+    lines = stdout.strip().split(b'\n')
     summary = json.loads(lines[0])
 
     # run_dir should be one of the delta directories
@@ -307,13 +380,12 @@ def test_wrapper_reject_run_dir_is_delta():
 
 def test_wrapper_reject_authoritative_line():
     """Wrapper prints exact authoritative line for REJECT."""
-    stdout, stderr, exit_code = run_wrapper(["payment succeeded"])
+    stdout, stderr, exit_code, lines, summary = _reject_run()
 
-    lines = stdout.strip().split('\n')
     assert len(lines) == 2, "Expected exactly 2 lines"
 
     # Exact output contract
-    assert lines[1] == "Authoritative output: NONE", (
+    assert lines[1] == b"Authoritative output: NONE", (
         f"Expected 'Authoritative output: NONE', got: {lines[1]}"
     )
 
@@ -322,30 +394,25 @@ def test_wrapper_reject_authoritative_line():
 
 def test_wrapper_propagates_exit_code():
     """Wrapper exit code equals ./brok exit code."""
-    # Test with ACCEPT input (should exit 0)
-    stdout, stderr, exit_code = run_wrapper(["create payment"])
-    assert exit_code == 0, "ACCEPT should exit 0"
+    # ACCEPT input (should exit 0)
+    assert _accept_run()[2] == 0, "ACCEPT should exit 0"
 
-    # Test with REJECT input (should also exit 0 - REJECT is valid)
-    stdout, stderr, exit_code = run_wrapper(["payment succeeded"])
-    assert exit_code == 0, "REJECT should also exit 0"
+    # REJECT input (should also exit 0 - REJECT is valid)
+    assert _reject_run()[2] == 0, "REJECT should also exit 0"
 
     print("[PASS] Wrapper propagates exit code correctly")
 
 
 def test_wrapper_cleans_temp_file():
     """Wrapper should not leave temp files behind."""
-    import glob
-
     # Count temp files before
-    artifacts_dir = os.path.join(_REPO_ROOT, "artifacts")
-    before = set(glob.glob(os.path.join(artifacts_dir, "brok_input_*")))
+    before = _temp_input_names()
 
     # Run wrapper
-    run_wrapper(["create payment"])
+    _invoke_wrapper(["create payment"])
 
     # Count temp files after
-    after = set(glob.glob(os.path.join(artifacts_dir, "brok_input_*")))
+    after = _temp_input_names()
 
     # Should be no new temp files
     new_temps = after - before
@@ -357,7 +424,7 @@ def test_wrapper_cleans_temp_file():
 def test_wrapper_failure_exit_codes():
     """Wrapper exit codes are distinct for different failure modes."""
     # Normal invocation - should exit 0
-    stdout_ok, stderr_ok, exit_ok = run_wrapper(["create payment"])
+    exit_ok = _accept_run()[2]
     assert exit_ok == 0, "Normal invocation should exit 0"
 
     # Wrong args - should exit 2
@@ -395,6 +462,10 @@ def main():
     passed = 0
     failed = 0
 
+    # Tests run one at a time on purpose. ./brok-run identifies its run by
+    # diffing artifacts/run/ before and after invoking ./brok, and identical
+    # inputs share a run directory, so concurrent wrapper runs would see
+    # each other's directories and could be reported as ambiguous.
     for name, test_func in tests:
         print(f"--- {name} ---")
         try:
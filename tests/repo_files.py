@@ -0,0 +1,27 @@
+"""
+Repository file walker shared by the L-1 and L-2 prohibition checks.
+"""
+
+import os
+
+
+def iter_files(path: str, excluded_dirs: set, file_ext: str = '.py'):
+    """
+    Recursively yield paths of files under path ending in file_ext.
+
+    Uses os.scandir directly: each DirEntry carries the file type from
+    the directory read, so no extra stat is needed, and excluded
+    directories are pruned by name before recursing. Files in a
+    directory are yielded before its subdirectories (os.walk order).
+    """
+    subdirs = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in excluded_dirs:
+                    subdirs.append(entry.path)
+            elif entry.name.endswith(file_ext) and entry.is_file():
+                yield entry.path
+
+    for subdir in subdirs:
+        yield from iter_files(subdir, excluded_dirs, file_ext)